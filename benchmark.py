@@ -0,0 +1,64 @@
+# benchmark.py
+import sys
+import argparse
+from utils.benchmark import (
+    DEFAULT_SIZES, DISTRIBUTIONS, run_benchmark, format_table, write_csv, write_json,
+    load_results, compare_to_baseline
+)
+
+def main(argv=None):
+    """Run the benchmark suite and optionally check it against a saved baseline"""
+    parser = argparse.ArgumentParser(description="Benchmark all sorting algorithms")
+    parser.add_argument('--algorithms', nargs='+', help="Algorithm names (default: all)")
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    parser.add_argument('--distributions', nargs='+', default=DISTRIBUTIONS, choices=DISTRIBUTIONS)
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0])
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per job (fastest is kept)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes (0 = one per CPU core)")
+    parser.add_argument('--timeout', type=float, help="Per-job time limit in seconds")
+    parser.add_argument('--no-trace', action='store_true', help="Metrics-only runs (no step recording)")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc peak memory run")
+    parser.add_argument('--vectorized', action='store_true',
+                        help="Use the NumPy fast path of the sorters that have one")
+    parser.add_argument('--csv', help="Write results to this CSV file")
+    parser.add_argument('--json', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Compare against results saved earlier (JSON or CSV)")
+    parser.add_argument('--time-tolerance', type=float, default=0.25)
+    parser.add_argument('--memory-tolerance', type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    def progress(done, total, row):
+        outcome = f"{row['time']:.4f}s" if row['status'] == 'ok' else row['status']
+        print(f"[{done}/{total}] {row['algorithm']:<16} {row['distribution']:<14} "
+              f"n={row['size']:<7} {outcome}")
+
+    results = run_benchmark(
+        args.algorithms, args.sizes, args.distributions, args.seeds,
+        record_steps=not args.no_trace, measure_memory=not args.no_memory,
+        repeat=args.repeat, timeout=args.timeout, vectorized=args.vectorized,
+        workers=args.workers or None,
+        progress=progress
+    )
+    print(format_table(results))
+
+    if args.csv:
+        write_csv(results, args.csv)
+    if args.json:
+        write_json(results, args.json)
+
+    if args.baseline:
+        regressions = compare_to_baseline(
+            results, load_results(args.baseline),
+            time_tolerance=args.time_tolerance, memory_tolerance=args.memory_tolerance
+        )
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"✅ No regressions against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
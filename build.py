@@ -16,6 +16,7 @@ def build_executable():
         '--add-data=gui;gui',           # Include gui folder
         '--add-data=sorting;sorting',   # Include sorting folder  
         '--add-data=utils;utils',       # Include utils folder
+        '--collect-submodules=sorting', # Sorter modules are imported by name on first use
         '--icon=icon.ico',              # Optional: add your own icon
         'main.py'
     ]
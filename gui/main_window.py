@@ -2,14 +2,25 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QTabWidget, QPushButton, QSlider, QLabel,
-    QComboBox, QSpinBox, QTextEdit, QGroupBox, QScrollArea, QGridLayout
+    QComboBox, QSpinBox, QTextEdit, QGroupBox, QScrollArea, QGridLayout,
+    QFileDialog, QProgressDialog
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from gui.visualization_widget import VisualizationWidget
+from gui.race_widget import RaceWidget
+from gui.playback import PlaybackClock
 from sorting import get_sorter
 from utils.array_generator import generate_array
+from utils.data_loader import FILE_FILTER, load_array, parse_values
 import numpy as np
-import re
+import os
+import time
+
+# Seconds of step generation allowed per playback frame, so frames stay regular
+FRAME_GENERATION_BUDGET = 0.010
+# Imported arrays up to this size are also written into the custom input box
+CUSTOM_TEXT_LIMIT = 1000
+CUSTOM_PLACEHOLDER = "5,2,8,1"
 
 class SortingSimulatorMainWindow(QMainWindow):
     def __init__(self):
@@ -18,10 +29,14 @@ class SortingSimulatorMainWindow(QMainWindow):
         self.resize(1200, 800)
 
         self.array = np.array([])
+        self.imported_array = None  # Last imported file, until the custom text is edited
         self.sorter = None
+        self.step_source = None  # Lazy step generator of the running sorter
         self.is_sorting = False
         self.paused = False
         self.step_index = 0
+        self.metrics_summary = ""  # Shown in the Performance tab once it is built
+        self.metrics_text = None
 
         self.init_ui()
         self.reset_array()
@@ -32,22 +47,26 @@ class SortingSimulatorMainWindow(QMainWindow):
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
 
-        # Create tab widget
+        # Create tab widget; the reference tabs are only built when first shown
         self.tabs = QTabWidget()
         self.simulator_tab = self.create_simulator_tab()
-        self.algorithms_tab = self.create_algorithms_tab()
-        self.performance_tab = self.create_performance_tab()
-        self.about_tab = self.create_about_tab()
+        self.race_tab = RaceWidget(lambda: self.array.copy())
+        self.lazy_tabs = {}  # Tab container -> function building its content
+        self.algorithms_tab = self.add_lazy_tab(self.create_algorithms_tab)
+        self.performance_tab = self.add_lazy_tab(self.create_performance_tab)
+        self.about_tab = self.add_lazy_tab(self.create_about_tab)
 
         self.tabs.addTab(self.simulator_tab, "Simulator")
+        self.tabs.addTab(self.race_tab, "Race")
         self.tabs.addTab(self.algorithms_tab, "Algorithms")
         self.tabs.addTab(self.performance_tab, "Performance")
         self.tabs.addTab(self.about_tab, "About")
+        self.tabs.currentChanged.connect(self.build_lazy_tab)
 
         main_layout.addWidget(self.tabs)
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.run_step)
+        self.playback = PlaybackClock(self.speed_slider, self)
+        self.playback.advance.connect(self.run_frame)
 
     def create_simulator_tab(self):
         # Main splitter: controls on left, visualization on right
@@ -92,17 +111,19 @@ class SortingSimulatorMainWindow(QMainWindow):
 
         # Custom array input
         self.custom_array_input = QTextEdit()
-        self.custom_array_input.setPlaceholderText("5,2,8,1")
+        self.custom_array_input.setPlaceholderText(CUSTOM_PLACEHOLDER)
+        self.custom_array_input.textChanged.connect(self.custom_text_edited)
         self.custom_array_input.setMaximumHeight(50)
         self.custom_array_input.hide()
         self.custom_array_input.setFixedHeight(50)
         controls_layout.addWidget(self.custom_array_input)
 
-        # CSV button
-        self.csv_btn = QPushButton("Import CSV")
-        self.csv_btn.setFixedHeight(28)
-        self.csv_btn.clicked.connect(self.import_csv)
-        controls_layout.addWidget(self.csv_btn)
+        # Import button
+        self.import_btn = QPushButton("Import Data")
+        self.import_btn.setToolTip("CSV/TSV/text, .npy, or raw little-endian .i32/.f64 files")
+        self.import_btn.setFixedHeight(28)
+        self.import_btn.clicked.connect(self.import_data)
+        controls_layout.addWidget(self.import_btn)
 
         # Algorithm selection
         algo_group = QGroupBox("Algorithm")
@@ -113,7 +134,8 @@ class SortingSimulatorMainWindow(QMainWindow):
             "Bubble Sort", "Insertion Sort", "Selection Sort",
             "Merge Sort", "Quick Sort", "Heap Sort", "Shell Sort",
             "Counting Sort", "Radix Sort", "Bucket Sort", "Pigeonhole Sort",
-            "Cocktail Sort", "Comb Sort", "IntroSort", "Bogo Sort"
+            "Cocktail Sort", "Comb Sort", "IntroSort", "Tim Sort", "External Sort",
+            "Bogo Sort"
         ])
         algo_layout.addWidget(self.algo_combo)
         algo_group.setLayout(algo_layout)
@@ -170,7 +192,19 @@ class SortingSimulatorMainWindow(QMainWindow):
         self.explanation_text.setReadOnly(True)
         self.explanation_text.setMaximumHeight(70)
         
+        # Timeline: jump to any recorded step of the trace
+        timeline_layout = QHBoxLayout()
+        self.seek_slider = QSlider(Qt.Orientation.Horizontal)
+        self.seek_slider.setRange(0, 0)
+        self.seek_slider.setEnabled(False)
+        self.seek_slider.valueChanged.connect(self.seek)
+        self.seek_label = QLabel("Step 0 / 0")
+        self.seek_label.setMinimumWidth(140)
+        timeline_layout.addWidget(self.seek_slider)
+        timeline_layout.addWidget(self.seek_label)
+
         right_layout.addWidget(self.vis_widget)
+        right_layout.addLayout(timeline_layout)
         right_layout.addWidget(self.explanation_text)
 
         # Add widgets to splitter
@@ -180,6 +214,20 @@ class SortingSimulatorMainWindow(QMainWindow):
 
         return splitter
 
+    def add_lazy_tab(self, create):
+        """Return an empty tab container that build_lazy_tab fills with create()."""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.lazy_tabs[container] = create
+        return container
+
+    def build_lazy_tab(self, index):
+        container = self.tabs.widget(index)
+        create = self.lazy_tabs.pop(container, None)
+        if create is not None:
+            container.layout().addWidget(create())
+
     def create_algorithms_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -230,6 +278,10 @@ class SortingSimulatorMainWindow(QMainWindow):
              "Improvement over bubble sort using shrinking gap (factor 1.3)."),
             ("IntroSort", "Hybrid Advanced Sort", "O(n log n)", "O(log n)", "No",
              "Hybrid: starts with quicksort, switches to heapsort if depth limit exceeded."),
+            ("Tim Sort", "Hybrid Advanced Sort", "O(n log n), O(n) on sorted runs", "O(n)", "Yes",
+             "Finds natural runs, extends short ones with binary insertion, then merges them with galloping."),
+            ("External Sort", "Hybrid Advanced Sort", "O(n log n)", "O(n) on disk", "Yes",
+             "Sorts memory-sized chunks into runs on disk, then merges all runs with buffered reads."),
             ("Bogo Sort", "Joke/Randomized Sort", "O(n × n!)", "O(1)", "No",
              "Randomly shuffles until array happens to be sorted. Never use in practice!")
         ]
@@ -273,6 +325,7 @@ class SortingSimulatorMainWindow(QMainWindow):
         layout = QVBoxLayout(widget)
         self.metrics_text = QTextEdit()
         self.metrics_text.setReadOnly(True)
+        self.metrics_text.setPlainText(self.metrics_summary)
         layout.addWidget(QLabel("Performance Metrics:"))
         layout.addWidget(self.metrics_text)
         return widget
@@ -300,12 +353,13 @@ class SortingSimulatorMainWindow(QMainWindow):
 <li>Click 'Start' to begin visualization.</li>
 <li>Use 'Step' buttons to move manually.</li>
 <li>Check 'Performance' tab for metrics.</li>
+<li>Use the 'Race' tab to run several algorithms side by side on the same array.</li>
 </ol>
 <h3>Algorithms Included</h3>
 <p><b>Basic:</b> Bubble, Insertion, Selection<br>
 <b>Efficient:</b> Merge, Quick, Heap, Shell<br>
 <b>Non-Comparison:</b> Counting, Radix, Bucket, Pigeonhole<br>
-<b>Hybrid/Advanced:</b> IntroSort, Cocktail, Comb, Bogo</p>
+<b>Hybrid/Advanced:</b> IntroSort, Tim Sort, External Sort, Cocktail, Comb, Bogo</p>
 """
         about_text.setHtml(about_content)
         layout.addWidget(about_text)
@@ -319,37 +373,67 @@ class SortingSimulatorMainWindow(QMainWindow):
             self.custom_array_input.hide()
             self.size_spin.setEnabled(True)
 
-    def import_csv(self):
-        from PyQt6.QtWidgets import QFileDialog
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, "Open CSV File", "", "CSV Files (*.csv);;All Files (*)"
-        )
-        if file_name:
-            try:
-                with open(file_name, 'r') as f:
-                    line = f.readline().strip()
-                numbers = re.split(r'[,\s]+', line)
-                numbers = [x for x in numbers if x]
-                self.array = np.array([float(x) for x in numbers])
-                self.type_combo.setCurrentText("Custom")
-                self.custom_array_input.setPlainText(','.join(map(str, self.array.astype(int))))
-                self.vis_widget.update_array(self.array)
-                self.explanation_text.setPlainText(f"Loaded {len(self.array)} values from {file_name}")
-            except Exception as e:
-                self.explanation_text.setPlainText(f"CSV Error: {e}")
+    def import_data(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "Import Data", "", FILE_FILTER)
+        if not file_name:
+            return
+
+        dialog = QProgressDialog(f"Loading {os.path.basename(file_name)}...", "Cancel", 0, 1000, self)
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(300)
+
+        def progress(done, total):
+            dialog.setValue(int(done * 1000 / max(1, total)))  # Also processes events
+            if dialog.wasCanceled():
+                raise InterruptedError
+
+        try:
+            array = np.asarray(load_array(file_name, progress=progress))
+            if len(array) == 0:
+                raise ValueError("no values found")
+        except InterruptedError:
+            self.explanation_text.setPlainText("Import cancelled.")
+            return
+        except (OSError, ValueError) as e:
+            self.explanation_text.setPlainText(f"Import Error: {e}")
+            return
+        finally:
+            dialog.close()
+
+        # Writing a huge array into the text box would take longer than loading it
+        if len(array) <= CUSTOM_TEXT_LIMIT:
+            self.custom_array_input.setPlainText(','.join(map(str, array.tolist())))
+        else:
+            self.custom_array_input.clear()
+            self.custom_array_input.setPlaceholderText(
+                f"{len(array):,} values imported from {os.path.basename(file_name)} (type to replace them)"
+            )
+        self.imported_array = array
+
+        self.type_combo.blockSignals(True)
+        self.type_combo.setCurrentText("Custom")
+        self.type_combo.blockSignals(False)
+        self.toggle_custom_input("Custom")
+        self.reset_all()
+        self.explanation_text.setPlainText(f"Loaded {len(array):,} values from {file_name}")
+
+    def custom_text_edited(self):
+        """Typing into the custom box replaces the imported array."""
+        self.imported_array = None
+        self.custom_array_input.setPlaceholderText(CUSTOM_PLACEHOLDER)
 
     def reset_array(self):
         array_type = self.type_combo.currentText().lower().replace(" ", "_")
         
         if array_type == "custom":
             text = self.custom_array_input.toPlainText().strip()
-            if not text:
+            if self.imported_array is not None:
+                self.array = self.imported_array.copy()
+            elif not text:
                 self.array = generate_array(10, "random")
             else:
                 try:
-                    numbers = re.split(r'[,\s]+', text)
-                    numbers = [x for x in numbers if x]
-                    self.array = np.array([float(x) for x in numbers])
+                    self.array = parse_values(text)
                     if len(self.array) == 0:
                         self.array = generate_array(10, "random")
                 except Exception as e:
@@ -361,16 +445,22 @@ class SortingSimulatorMainWindow(QMainWindow):
         
         self.vis_widget.update_array(self.array)
         self.explanation_text.clear()
-        self.metrics_text.clear()
+        self.show_metrics("")
 
     def reset_all(self):
-        self.timer.stop()
+        self.playback.stop()
         self.is_sorting = False
         self.paused = False
         self.step_index = 0
         self.sorter = None
+        self.step_source = None
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
+        self.seek_slider.blockSignals(True)
+        self.seek_slider.setRange(0, 0)
+        self.seek_slider.blockSignals(False)
+        self.seek_slider.setEnabled(False)
+        self.seek_label.setText("Step 0 / 0")
         self.reset_array()
 
     def start_sorting(self):
@@ -378,94 +468,136 @@ class SortingSimulatorMainWindow(QMainWindow):
             return
         algo_name = self.algo_combo.currentText()
         self.sorter = get_sorter(algo_name, self.array.copy())
-        self.sorter.sort()
+        # Steps are produced on demand by run_frame, so playback starts immediately
+        self.step_source = self.sorter.iter_steps()
         self.is_sorting = True
         self.paused = False
         self.step_index = 0
         self.start_btn.setEnabled(False)
         self.pause_btn.setEnabled(True)
         self.pause_btn.setText("Pause")
-        self.run_step()
+        self.seek_slider.setEnabled(True)
+        # Show the initial state right away, then hand over to the frame scheduler
+        self.run_frame(1)
+        if self.is_sorting:
+            self.playback.start()
 
     def toggle_pause(self):
         self.paused = not self.paused
         self.pause_btn.setText("Resume" if self.paused else "Pause")
-        if not self.paused and self.is_sorting:
-            self.run_step()
+        if self.paused:
+            self.playback.stop()
+        elif self.is_sorting:
+            self.playback.start()
+
+    def ensure_step(self, index, deadline=None):
+        """
+        Pull steps from the sorter until step index exists. Returns False past
+        the end of the trace, or if the perf_counter() deadline passes first.
+        """
+        pulled = 0
+        while self.step_source is not None and index >= len(self.sorter.steps):
+            if deadline is not None and pulled & 255 == 0 and time.perf_counter() > deadline:
+                break
+            try:
+                next(self.step_source)
+            except StopIteration:
+                self.step_source = None
+            pulled += 1
+        return self.sorter is not None and index < len(self.sorter.steps)
 
     def step_forward(self):
-        if not self.sorter or not self.sorter.steps:
+        if not self.sorter:
             return
-        self.timer.stop()
-        if self.step_index < len(self.sorter.steps):
-            step = self.sorter.steps[self.step_index]
-            self.vis_widget.update_array(step['array'], step.get('highlights', {}))
-            self.explanation_text.setPlainText(step.get('explanation', ''))
-            self.update_metrics_for_step(self.step_index)
+        self.playback.stop()
+        if self.ensure_step(self.step_index):
+            self.show_step(self.step_index)
             self.step_index += 1
 
     def step_backward(self):
-        if not self.sorter or not self.sorter.steps or self.step_index <= 0:
+        # step_index is the next step to show, so the one on screen is step_index - 1
+        if not self.sorter or self.step_index <= 1:
             return
-        self.timer.stop()
+        self.playback.stop()
         self.step_index -= 1
-        state = self.sorter.get_state_at(self.step_index)
-        self.vis_widget.update_array(state['array'], state.get('highlights', {}))
-        self.explanation_text.setPlainText(state.get('explanation', ''))
-        self.update_metrics_for_step(self.step_index)
+        self.show_step(self.step_index - 1)
+
+    def seek(self, index):
+        """
+        Jump straight to a recorded step. The step log rebuilds it from the
+        nearest keyframe, so the cost does not depend on how far away it is.
+        Playback, if running, continues from the new position.
+        """
+        if not self.sorter or not self.ensure_step(index):
+            return
+        self.show_step(index)
+        self.step_index = index + 1
 
-    def run_step(self):
+    def run_frame(self, steps):
+        """Advance playback by steps logical steps, rendering only the last one."""
         if not self.is_sorting or self.paused:
             return
 
-        if self.step_index >= len(self.sorter.steps):
+        target = self.step_index + steps - 1
+        if not self.ensure_step(target, time.perf_counter() + FRAME_GENERATION_BUDGET):
+            # The trace ends within this frame, or generating it is the bottleneck
+            target = len(self.sorter.steps) - 1
+        if target >= self.step_index:
+            self.show_step(target)
+            self.step_index = target + 1
+
+        if not self.ensure_step(self.step_index):
             self.sorting_finished()
-            return
 
-        step = self.sorter.steps[self.step_index]
+    def show_step(self, index):
+        step = self.sorter.steps[index]
         self.vis_widget.update_array(step['array'], step.get('highlights', {}))
         self.explanation_text.setPlainText(step.get('explanation', ''))
-        self.update_metrics_for_step(self.step_index)
-
-        self.step_index += 1
-
-        if self.step_index < len(self.sorter.steps):
-            delay = max(10, 200 - self.speed_slider.value() * 2)
-            self.timer.start(delay)
-        else:
-            self.sorting_finished()
+        self.update_metrics_for_step(index)
+        self.update_timeline(index)
+
+    def update_timeline(self, index):
+        """Move the seek slider to index; its range covers the steps recorded so far."""
+        total = len(self.sorter.steps)
+        self.seek_slider.blockSignals(True)
+        self.seek_slider.setMaximum(total - 1)
+        self.seek_slider.setValue(index)
+        self.seek_slider.blockSignals(False)
+        # '+' while the trace is still being generated
+        more = "+" if self.step_source is not None else ""
+        self.seek_label.setText(f"Step {index + 1} / {total}{more}")
 
     def update_metrics_for_step(self, step_index):
-        if not self.sorter:
+        if not self.sorter or not 0 <= step_index < len(self.sorter.steps):
             return
-        total_comparisons = self.sorter.comparisons
-        total_swaps = self.sorter.swaps
-        total_time = self.sorter.get_metrics()['time']
-
-        total_steps = len(self.sorter.steps)
-        if total_steps == 0:
-            progress = 1.0
-        else:
-            progress = min(1.0, step_index / total_steps)
-
-        current_comparisons = int(total_comparisons * progress)
-        current_swaps = int(total_swaps * progress)
-        current_time = total_time * progress
+        # Exact cumulative values recorded with the step
+        comparisons, swaps, elapsed = self.sorter.steps.metrics_at(step_index)
 
         text = (
-            f"Comparisons: {current_comparisons}\n"
-            f"Swaps: {current_swaps}\n"
-            f"Time: {current_time:.4f} seconds (estimated)"
+            f"Comparisons: {comparisons}\n"
+            f"Swaps: {swaps}\n"
+            f"Time: {elapsed:.4f} seconds"
         )
-        self.metrics_text.setPlainText(text)
+        self.show_metrics(text)
+
+    def show_metrics(self, text):
+        self.metrics_summary = text
+        if self.metrics_text is not None:
+            self.metrics_text.setPlainText(text)
 
     def sorting_finished(self):
-        self.timer.stop()
+        self.playback.stop()
         self.is_sorting = False
+        self.update_timeline(self.step_index - 1)
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self.explanation_text.append("\n✅ Sorting completed!")
 
+    def closeEvent(self, event):
+        # Stop race trace workers before their QThreads are destroyed
+        self.race_tab.stop_race()
+        super().closeEvent(event)
+
     def apply_academic_theme(self):
         self.setStyleSheet("""
             QMainWindow, QWidget {
@@ -0,0 +1,57 @@
+# gui/playback.py
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, Qt, pyqtSignal
+
+
+class PlaybackClock(QObject):
+    """
+    Frame scheduler for step playback.
+
+    Ticks at a fixed display frame rate and emits advance(n) with the number
+    of logical steps that are due since the previous frame, based on the
+    wall-clock time elapsed and the speed slider. Receivers jump straight to
+    the latest state, so a frame costs one repaint however many steps it
+    covers, and a 500k-step trace plays in seconds at full speed.
+    """
+    advance = pyqtSignal(int)
+
+    FRAME_INTERVAL_MS = 16  # ~60 fps
+    MIN_STEPS_PER_SECOND = 2
+    MAX_STEPS_PER_SECOND = 500_000
+    MAX_FRAME_GAP_MS = 100  # Don't try to catch up after the event loop stalls
+
+    def __init__(self, speed_slider, parent=None):
+        super().__init__(parent)
+        self.speed_slider = speed_slider
+        self.budget = 0.0  # Steps owed, including the fractional part
+        self.clock = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(self.FRAME_INTERVAL_MS)
+        self.timer.timeout.connect(self.tick)
+
+    def steps_per_second(self):
+        """Map the slider exponentially onto [MIN_STEPS_PER_SECOND, MAX_STEPS_PER_SECOND]."""
+        slider = self.speed_slider
+        fraction = (slider.value() - slider.minimum()) / max(1, slider.maximum() - slider.minimum())
+        ratio = self.MAX_STEPS_PER_SECOND / self.MIN_STEPS_PER_SECOND
+        # Cubing keeps the middle of the slider at watchable speeds (~10 steps/s)
+        return self.MIN_STEPS_PER_SECOND * ratio ** (fraction ** 3)
+
+    def start(self):
+        self.budget = 0.0
+        self.clock.start()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def is_active(self):
+        return self.timer.isActive()
+
+    def tick(self):
+        elapsed = min(self.clock.restart(), self.MAX_FRAME_GAP_MS) / 1000
+        self.budget += elapsed * self.steps_per_second()
+        steps = int(self.budget)
+        if steps:
+            self.budget -= steps
+            self.advance.emit(steps)
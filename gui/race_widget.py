@@ -0,0 +1,241 @@
+# gui/race_widget.py
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
+    QComboBox, QSlider, QListWidget, QListWidgetItem, QGroupBox, QSplitter
+)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from gui.visualization_widget import VisualizationWidget
+from gui.playback import PlaybackClock
+from sorting import ALL_ALGORITHMS, get_sorter
+
+
+class TraceWorker(QThread):
+    """Builds one sorter's full trace off the GUI thread."""
+    trace_ready = pyqtSignal(int, object)  # (lane index, finished sorter)
+    trace_failed = pyqtSignal(str)
+
+    def __init__(self, lane_index, algorithm, array, parent=None):
+        super().__init__(parent)
+        self.lane_index = lane_index
+        self.algorithm = algorithm
+        self.array = array
+
+    def run(self):
+        try:
+            sorter = get_sorter(self.algorithm, self.array)
+            # Pull steps one at a time so the race can be cancelled mid-trace
+            for _ in sorter.iter_steps():
+                if self.isInterruptionRequested():
+                    return
+        except Exception as e:
+            self.trace_failed.emit(f"{self.algorithm}: {e}")
+            return
+        self.trace_ready.emit(self.lane_index, sorter)
+
+
+class RaceLane(QWidget):
+    """One racer: a title line and its own bar chart."""
+    def __init__(self, algorithm):
+        super().__init__()
+        self.algorithm = algorithm
+        self.sorter = None
+        self.shown_step = -1
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        self.title = QLabel(f"<b>{algorithm}</b> — generating trace...")
+        self.vis_widget = VisualizationWidget()
+        layout.addWidget(self.title)
+        layout.addWidget(self.vis_widget)
+
+    def total_steps(self):
+        return len(self.sorter.steps) if self.sorter else 0
+
+    def show_step(self, index):
+        """Display step index (clamped to the trace) unless it is already shown."""
+        index = min(index, self.total_steps() - 1)
+        if index < 0 or index == self.shown_step:
+            return
+        self.shown_step = index
+        step = self.sorter.steps[index]
+        self.vis_widget.update_array(step['array'], step.get('highlights', {}))
+        state = "finished" if index == self.total_steps() - 1 else "running"
+        comparisons, swaps, _ = self.sorter.steps.metrics_at(index)
+        self.title.setText(
+            f"<b>{self.algorithm}</b> — step {index + 1}/{self.total_steps()} ({state}), "
+            f"{comparisons} comparisons, {swaps} swaps"
+        )
+
+
+class RaceWidget(QWidget):
+    """
+    Race several algorithms side by side on the same input.
+
+    Each trace is produced by its own TraceWorker thread, so the event loop
+    keeps running while large inputs are sorted. Playback is synchronized
+    either by logical step (every lane advances one step per step) or by
+    normalized progress (every lane reaches its end at the same time).
+    """
+    SYNC_STEP = "Logical step"
+    SYNC_PROGRESS = "Normalized progress"
+
+    def __init__(self, array_source):
+        super().__init__()
+        self.array_source = array_source  # Callable returning the array to race on
+        self.lanes = []
+        self.workers = []
+        self.pending = 0
+        self.position = 0.0  # Current step (logical mode) or progress in [0, 1]
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        # Left panel: racers and controls
+        controls = QWidget()
+        controls_layout = QVBoxLayout(controls)
+        controls_layout.setContentsMargins(8, 8, 8, 8)
+
+        algo_group = QGroupBox("Racers")
+        algo_layout = QVBoxLayout()
+        self.algo_list = QListWidget()
+        for name in ALL_ALGORITHMS:
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            checked = name in ("Bubble Sort", "Quick Sort", "Merge Sort")
+            item.setCheckState(Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked)
+            self.algo_list.addItem(item)
+        algo_layout.addWidget(self.algo_list)
+        algo_group.setLayout(algo_layout)
+        controls_layout.addWidget(algo_group)
+
+        sync_group = QGroupBox("Synchronize by")
+        sync_layout = QVBoxLayout()
+        self.sync_combo = QComboBox()
+        self.sync_combo.addItems([self.SYNC_STEP, self.SYNC_PROGRESS])
+        sync_layout.addWidget(self.sync_combo)
+        sync_group.setLayout(sync_layout)
+        controls_layout.addWidget(sync_group)
+
+        speed_group = QGroupBox("Speed")
+        speed_layout = QVBoxLayout()
+        self.speed_slider = QSlider(Qt.Orientation.Horizontal)
+        self.speed_slider.setRange(1, 100)
+        self.speed_slider.setValue(50)
+        speed_layout.addWidget(self.speed_slider)
+        speed_group.setLayout(speed_layout)
+        controls_layout.addWidget(speed_group)
+        self.playback = PlaybackClock(self.speed_slider, self)
+        self.playback.advance.connect(self.advance)
+
+        buttons_layout = QHBoxLayout()
+        self.start_btn = QPushButton("Start Race")
+        self.stop_btn = QPushButton("Stop")
+        self.stop_btn.setEnabled(False)
+        self.start_btn.clicked.connect(self.start_race)
+        self.stop_btn.clicked.connect(self.stop_race)
+        buttons_layout.addWidget(self.start_btn)
+        buttons_layout.addWidget(self.stop_btn)
+        controls_layout.addLayout(buttons_layout)
+
+        self.status_label = QLabel("Uses the array from the Simulator tab.")
+        self.status_label.setWordWrap(True)
+        controls_layout.addWidget(self.status_label)
+        controls_layout.addStretch()
+
+        # Right panel: one lane per racer
+        self.lanes_widget = QWidget()
+        self.lanes_layout = QGridLayout(self.lanes_widget)
+
+        splitter.addWidget(controls)
+        splitter.addWidget(self.lanes_widget)
+        splitter.setSizes([220, 980])
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(splitter)
+
+    def selected_algorithms(self):
+        return [self.algo_list.item(i).text() for i in range(self.algo_list.count())
+                if self.algo_list.item(i).checkState() == Qt.CheckState.Checked]
+
+    def start_race(self):
+        algorithms = self.selected_algorithms()
+        if not algorithms:
+            self.status_label.setText("Select at least one algorithm.")
+            return
+        self.stop_race()
+        self.clear_lanes()
+
+        array = self.array_source()
+        columns = 1 if len(algorithms) == 1 else 2
+        for i, name in enumerate(algorithms):
+            lane = RaceLane(name)
+            lane.vis_widget.update_array(array)
+            self.lanes_layout.addWidget(lane, i // columns, i % columns)
+            self.lanes.append(lane)
+
+            worker = TraceWorker(i, name, array.copy(), self)
+            worker.trace_ready.connect(self.trace_ready)
+            worker.trace_failed.connect(self.trace_failed)
+            self.workers.append(worker)
+
+        self.pending = len(self.workers)
+        self.status_label.setText(f"Generating {self.pending} traces...")
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        for worker in self.workers:
+            worker.start()
+
+    def trace_ready(self, lane_index, sorter):
+        lane = self.lanes[lane_index]
+        lane.sorter = sorter
+        lane.show_step(0)
+        self.pending -= 1
+        if self.pending:
+            done = len(self.workers) - self.pending
+            self.status_label.setText(f"Generated {done}/{len(self.workers)} traces...")
+            return
+        self.position = 0.0
+        self.status_label.setText("Racing!")
+        self.playback.start()
+
+    def trace_failed(self, message):
+        self.status_label.setText(f"Trace failed: {message}")
+        self.stop_race()
+
+    def advance(self, steps):
+        """Move every lane forward by steps logical steps of the longest trace."""
+        longest = max(lane.total_steps() for lane in self.lanes)
+
+        if self.sync_combo.currentText() == self.SYNC_STEP:
+            self.position += steps
+            for lane in self.lanes:
+                lane.show_step(int(self.position))
+            finished = self.position >= longest - 1
+        else:
+            self.position = min(1.0, self.position + steps / max(1, longest - 1))
+            for lane in self.lanes:
+                lane.show_step(round(self.position * (lane.total_steps() - 1)))
+            finished = self.position >= 1.0
+
+        if finished:
+            self.playback.stop()
+            self.status_label.setText("Race finished.")
+            self.start_btn.setEnabled(True)
+            self.stop_btn.setEnabled(False)
+
+    def stop_race(self):
+        self.playback.stop()
+        for worker in self.workers:
+            worker.trace_ready.disconnect()
+            worker.trace_failed.disconnect()
+            worker.requestInterruption()
+            worker.wait()
+        self.workers = []
+        self.pending = 0
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+    def clear_lanes(self):
+        for lane in self.lanes:
+            self.lanes_layout.removeWidget(lane)
+            lane.deleteLater()
+        self.lanes = []
@@ -1,78 +1,219 @@
 # gui/visualization_widget.py
+import numpy as np
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics, QPixmap
 from PyQt6.QtCore import Qt, QRect
 
+# Bar colors, indexed by the per-bar color code
+DEFAULT, COMPARING, SWAPPING, SORTED = range(4)
+BAR_COLORS = [
+    QColor(70, 130, 180),   # SteelBlue (default)
+    QColor(220, 20, 60),    # Crimson (comparing)
+    QColor(50, 205, 50),    # LimeGreen (swapping)
+    QColor(169, 169, 169),  # DarkGray (sorted)
+]
+
+# Highlight kinds in increasing priority: later kinds paint over earlier ones
+HIGHLIGHT_CODES = [('sorted', SORTED), ('swapping', SWAPPING), ('comparing', COMPARING)]
+
+
+def _highlight_indices(indices, n):
+    """Turn a highlight list or range into an index array clipped to [0, n)."""
+    if isinstance(indices, range):
+        indices = np.arange(indices.start, indices.stop, indices.step)
+    else:
+        indices = np.asarray(indices, dtype=np.intp).ravel()
+    return indices[(indices >= 0) & (indices < n)]
+
+
 class VisualizationWidget(QWidget):
     """
     Widget to visualize an array as vertical bars with value labels underneath.
     Supports highlighting for comparisons, swaps, and sorted regions.
+
+    Highlights are resolved once per update into a per-bar color code array,
+    and bars of the same color are drawn with a single drawRects call.
+
+    The chart is kept in a backing pixmap. update_array diffs the new frame
+    against the previous one and only the bars whose value or color changed
+    are redrawn into it and repainted, so a step that swaps two bars costs
+    the same for 50 bars as for 50,000.
     """
+    LABEL_HEIGHT = 30  # Space reserved at the bottom for labels
+    MAX_DIRTY_FRACTION = 0.25  # Beyond this share of changed bars, redraw everything
+
     def __init__(self):
         super().__init__()
-        self.array = []
+        self.array = np.empty(0)
         self.highlights = {}  # e.g., {'comparing': [i,j], 'swapping': [k,l], 'sorted': [m,n,...]}
+        self.colors = np.empty(0, dtype=np.uint8)  # Color code of every bar
+
+        self.backing = None  # Pixmap holding the last rendered chart
+        self.layout_params = None  # Geometry the backing pixmap was drawn with
+        self.dirty = None  # Bars to redraw into the backing pixmap; None means all
+        # Every pixel is painted from the backing pixmap
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
 
     def update_array(self, array, highlights=None):
         """Update the displayed array and highlights."""
-        self.array = list(array) if array is not None else []
+        array = np.asarray(array if array is not None else [], dtype=float).ravel()
         self.highlights = highlights or {}
-        self.update()  # Triggers repaint
 
-    def paintEvent(self, event):
-        if not self.array:
+        n = len(array)
+        colors = np.full(n, DEFAULT, dtype=np.uint8)
+        for kind, code in HIGHLIGHT_CODES:
+            if kind in self.highlights:
+                colors[_highlight_indices(self.highlights[kind], n)] = code
+
+        previous, previous_colors = self.array, self.colors
+        self.array, self.colors = array, colors
+
+        # Incremental updates need the same bar geometry and value scale
+        if (self.layout_params is None or self.dirty is None or n == 0
+                or n != len(previous) or array.min() != previous.min()
+                or array.max() != previous.max()):
+            self.invalidate()
             return
 
-        painter = QPainter(self)
-        width = self.width()
-        height = self.height()
-        n = len(self.array)
-        if n == 0:
+        changed = np.flatnonzero((array != previous) | (colors != previous_colors))
+        if len(changed) == 0:
             return
+        if len(changed) + len(self.dirty) > n * self.MAX_DIRTY_FRACTION:
+            self.invalidate()
+            return
+
+        # A bar's outline ends on the first pixel column of the next bar
+        # (for the last bar, that column is part of its own bar_rect)
+        changed = np.concatenate((changed, changed + 1))
+        changed = changed[changed < n]
+        self.dirty.update(changed.tolist())
+        bar_width, drawing_height, _, _, stride = self.layout_params
+        for i in changed.tolist():
+            self.update(self.bar_rect(i, bar_width, drawing_height))
+            if i % stride == 0:
+                self.update(self.label_rect(i, bar_width, drawing_height, stride))
 
-        # Reserve space at the bottom for labels (30px)
-        label_height = 30
-        drawing_height = height - label_height
+    def invalidate(self):
+        """Redraw the whole chart on the next paint."""
+        self.dirty = None
+        self.update()
+
+    def resizeEvent(self, event):
+        self.invalidate()
+        super().resizeEvent(event)
+
+    def compute_layout(self):
+        """Return (bar_width, drawing_height, min_val, value_range, label_stride)."""
+        n = len(self.array)
+        drawing_height = self.height() - self.LABEL_HEIGHT
         if drawing_height <= 0:
-            drawing_height = height
+            drawing_height = self.height()
 
         # Prevent division by zero
-        bar_width = max(1, width // n)
-        max_val = max(self.array) if self.array else 1
-        min_val = min(self.array) if self.array else 0
+        bar_width = max(1, self.width() // n)
+        max_val = self.array.max()
+        min_val = self.array.min()
         value_range = max_val - min_val if max_val != min_val else 1
 
-        # Set up font for labels
+        # Label every stride-th bar so labels never overlap
+        font_metrics = QFontMetrics(self.label_font(bar_width))
+        widest = max(font_metrics.horizontalAdvance(str(int(val))) for val in (min_val, max_val))
+        stride = -(-(widest + 4) // bar_width)  # Bars per label, rounded up
+        return bar_width, drawing_height, min_val, value_range, stride
+
+    def label_font(self, bar_width):
         font_size = max(6, min(14, bar_width // 2))
-        font = QFont("Segoe UI", font_size, QFont.Weight.Normal)
-        painter.setFont(font)
-        font_metrics = QFontMetrics(font)
+        return QFont("Segoe UI", font_size, QFont.Weight.Normal)
 
-        for i, val in enumerate(self.array):
-            x = i * bar_width
-            # Normalize value to [0,1] then scale to drawing_height
-            normalized = (val - min_val) / value_range
-            bar_height = int(normalized * drawing_height)
-            y = drawing_height - bar_height  # Start from top of drawing area
-
-            # Determine bar color
-            color = QColor(70, 130, 180)  # SteelBlue (default)
-            if i in self.highlights.get('comparing', []):
-                color = QColor(220, 20, 60)      # Crimson (comparing)
-            elif i in self.highlights.get('swapping', []):
-                color = QColor(50, 205, 50)      # LimeGreen (swapping)
-            elif i in self.highlights.get('sorted', []):
-                color = QColor(169, 169, 169)    # DarkGray (sorted)
-
-            # Draw bar
-            painter.setBrush(QBrush(color))
+    def bar_rect(self, i, bar_width, drawing_height):
+        """
+        Area owned by bar i, including its outline's bottom row. The last bar
+        also owns the column after it, where its outline's right edge ends.
+        """
+        width = bar_width + 1 if i == len(self.array) - 1 else bar_width
+        return QRect(i * bar_width, 0, width, drawing_height + 1)
+
+    def label_rect(self, i, bar_width, drawing_height, stride):
+        """Area owned by the label under bar i (labels are centered on their bar)."""
+        span = stride * bar_width
+        x = i * bar_width + bar_width // 2 - span // 2
+        return QRect(x, drawing_height + 1, span, self.height() - drawing_height - 1)
+
+    def paintEvent(self, event):
+        size = self.size() * self.devicePixelRatio()
+        if self.backing is None or self.backing.size() != size:
+            self.backing = QPixmap(size)
+            self.backing.setDevicePixelRatio(self.devicePixelRatio())
+            self.dirty = None
+
+        if self.dirty is None:
+            self.render_all()
+        elif self.dirty:
+            self.render_bars(np.fromiter(sorted(self.dirty), dtype=np.intp))
+        self.dirty = set()
+
+        painter = QPainter(self)
+        painter.setClipRegion(event.region())
+        painter.drawPixmap(0, 0, self.backing)
+
+    def render_all(self):
+        """Draw the whole chart into the backing pixmap."""
+        background = self.palette().color(self.backgroundRole())
+        self.backing.fill(background)
+        if len(self.array) == 0:
+            self.layout_params = None
+            return
+        self.layout_params = self.compute_layout()
+        self.render_bars(np.arange(len(self.array)), clear=False)
+
+    def render_bars(self, indices, clear=True):
+        """Draw the given bars and their labels into the backing pixmap."""
+        bar_width, drawing_height, min_val, value_range, stride = self.layout_params
+        background = self.palette().color(self.backgroundRole())
+        labelled = indices[indices % stride == 0]
+
+        painter = QPainter(self.backing)
+        if clear:
+            for i in indices.tolist():
+                painter.fillRect(self.bar_rect(i, bar_width, drawing_height), background)
+            for i in labelled.tolist():
+                painter.fillRect(self.label_rect(i, bar_width, drawing_height, stride), background)
+            # Clearing a bar also erased the right edge of the outline of the bar before it
+            indices = np.union1d(indices, indices[indices > 0] - 1)
+
+        # Normalize values to [0,1] then scale to drawing_height
+        bar_heights = ((self.array[indices] - min_val) / value_range * drawing_height).astype(int)
+        colors = self.colors[indices]
+
+        # Outlines would hide the fill of very thin bars
+        if bar_width >= 3:
             painter.setPen(QPen(Qt.GlobalColor.black, 1))
-            painter.drawRect(QRect(x, y, bar_width, bar_height))
+        else:
+            painter.setPen(Qt.PenStyle.NoPen)
+
+        for code, color in enumerate(BAR_COLORS):
+            group = np.flatnonzero(colors == code)
+            if len(group) == 0:
+                continue
+            painter.setBrush(QBrush(color))
+            painter.drawRects([
+                QRect(i * bar_width, drawing_height - h, bar_width, h)
+                for i, h in zip(indices[group].tolist(), bar_heights[group].tolist())
+            ])
+
+        self.draw_labels(painter, labelled, bar_width)
+        painter.end()
+
+    def draw_labels(self, painter, indices, bar_width):
+        """Draw value labels centered under the given bars."""
+        font = self.label_font(bar_width)
+        painter.setFont(font)
+        painter.setPen(QPen(Qt.GlobalColor.black))
+        font_metrics = QFontMetrics(font)
+        text_y = self.height() - 8  # 8px from bottom
 
-            # Draw value label centered under the bar
-            label = str(int(val))
+        for i in indices.tolist():
+            label = str(int(self.array[i]))
             text_width = font_metrics.horizontalAdvance(label)
-            text_x = x + (bar_width - text_width) // 2
-            text_y = height - 8  # 8px from bottom
-            painter.setPen(QPen(Qt.GlobalColor.black))
-            painter.drawText(text_x, text_y, label)
\ No newline at end of file
+            text_x = i * bar_width + (bar_width - text_width) // 2
+            painter.drawText(text_x, text_y, label)
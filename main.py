@@ -1,13 +1,49 @@
 # main.py
 import sys
-from PyQt6.QtWidgets import QApplication
-from gui.main_window import SortingSimulatorMainWindow
+from utils.startup_timer import StartupTimer
+
+# --startup-report prints the startup phases to stderr; --startup-report=PATH
+# writes them to a file instead (windowed builds have no console)
+STARTUP_REPORT = "--startup-report"
 
 def main():
+    timer = StartupTimer()
+    report_path = None
+    for arg in sys.argv[1:]:
+        if arg == STARTUP_REPORT or arg.startswith(STARTUP_REPORT + "="):
+            report_path = arg.partition("=")[2] or "-"
+            sys.argv.remove(arg)
+            break
+
+    # Imported here rather than at the top so each phase can be timed
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+    timer.mark("Import PyQt6")
+    from gui.main_window import SortingSimulatorMainWindow
+    timer.mark("Import gui, sorting and NumPy")
+
     app = QApplication(sys.argv)
+    timer.mark("Create QApplication")
     window = SortingSimulatorMainWindow()
+    timer.mark("Build main window")
     window.show()
+
+    if report_path:
+        # Runs on the first event loop pass, once the window has been shown
+        QTimer.singleShot(0, lambda: write_startup_report(timer, report_path))
     sys.exit(app.exec())
 
+def write_startup_report(timer, path):
+    from sorting import SORTER_MAP
+    timer.mark("Show window")
+    report = (f"{timer.report()}\n"
+              f"Sorter modules imported: {len(SORTER_MAP.loaded())} of {len(SORTER_MAP)}\n")
+    if path == "-":
+        if sys.stderr is not None:
+            sys.stderr.write(report)
+    else:
+        with open(path, 'w') as f:
+            f.write(report)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
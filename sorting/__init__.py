@@ -1,65 +1,112 @@
 # sorting/__init__.py
+from collections.abc import Mapping
+from importlib import import_module
 from .base_sorter import BaseSorter
+from .step_log import Step, StepLog
 
 class PlaceholderSorter(BaseSorter):
-    def sort(self):
+    def sort_steps(self):
         arr = self.original_array.copy()
-        self.record_step(arr, "This algorithm is not implemented yet.")
+        yield self.record_step(arr, "This algorithm is not implemented yet.")
         return arr
 
-# Import all implemented sorters
-from .bubble_sort import BubbleSort
-from .insertion_sort import InsertionSort
-from .selection_sort import SelectionSort
-from .merge_sort import MergeSort
-from .quick_sort import QuickSort
-from .heap_sort import HeapSort
-from .counting_sort import CountingSort
-from .radix_sort import RadixSort
-from .bucket_sort import BucketSort
-from .cocktail_sort import CocktailSort
-from .comb_sort import CombSort
-from .pigeonhole_sort import PigeonholeSort
-from .bogo_sort import BogoSort
-from .shell_sort import ShellSort
-from .introsort import IntroSort
+# Algorithm names -> (module, class) of every implemented sorter. The modules
+# are only imported when a sorter is first used (see SorterRegistry), so
+# importing the package stays cheap for the GUI and the command line.
+SORTER_MODULES = {
+    "Bubble Sort": ("bubble_sort", "BubbleSort"),
+    "Insertion Sort": ("insertion_sort", "InsertionSort"),
+    "Selection Sort": ("selection_sort", "SelectionSort"),
+    "Merge Sort": ("merge_sort", "MergeSort"),
+    "Quick Sort": ("quick_sort", "QuickSort"),
+    "Heap Sort": ("heap_sort", "HeapSort"),
+    "Shell Sort": ("shell_sort", "ShellSort"),
+    "Counting Sort": ("counting_sort", "CountingSort"),
+    "Radix Sort": ("radix_sort", "RadixSort"),
+    "Bucket Sort": ("bucket_sort", "BucketSort"),
+    "Cocktail Sort": ("cocktail_sort", "CocktailSort"),
+    "Comb Sort": ("comb_sort", "CombSort"),
+    "Pigeonhole Sort": ("pigeonhole_sort", "PigeonholeSort"),
+    "IntroSort": ("introsort", "IntroSort"),
+    "Tim Sort": ("tim_sort", "TimSort"),
+    "External Sort": ("external_sort", "ExternalSort"),
+    "Bogo Sort": ("bogo_sort", "BogoSort"),
 
-# Map algorithm names to classes
-SORTER_MAP = {
-    "Bubble Sort": BubbleSort,
-    "Insertion Sort": InsertionSort,
-    "Selection Sort": SelectionSort,
-    "Merge Sort": MergeSort,
-    "Quick Sort": QuickSort,
-    "Heap Sort": HeapSort,
-    "Shell Sort": ShellSort, 
-    "Counting Sort": CountingSort,
-    "Radix Sort": RadixSort,
-    "Bucket Sort": BucketSort,
-    "Cocktail Sort": CocktailSort,
-    "Comb Sort": CombSort,
-    "Pigeonhole Sort": PigeonholeSort,
-    "IntroSort": IntroSort,  
-    "Bogo Sort": BogoSort,
-    
     # Add more as you implement them
 }
 
-# Fill unimplemented algorithms with placeholder
 ALL_ALGORITHMS = [
     "Bubble Sort", "Insertion Sort", "Selection Sort",
     "Merge Sort", "Quick Sort", "Heap Sort", "Shell Sort",
     "Counting Sort", "Radix Sort", "Bucket Sort", "Pigeonhole Sort",
-    "Cocktail Sort", "Comb Sort", "IntroSort", "Bogo Sort"
+    "Cocktail Sort", "Comb Sort", "IntroSort", "Tim Sort", "External Sort", "Bogo Sort"
 ]
 
-for algo in ALL_ALGORITHMS:
-    if algo not in SORTER_MAP:
-        SORTER_MAP[algo] = PlaceholderSorter
+_CLASS_NAMES = {cls_name: name for name, (_, cls_name) in SORTER_MODULES.items()}
+
+
+class SorterRegistry(Mapping):
+    """
+    Read-only mapping of algorithm names to sorter classes that imports each
+    sorter module on first lookup. Every name in ALL_ALGORITHMS is a key;
+    unimplemented ones map to PlaceholderSorter.
+    """
+    def __init__(self):
+        self._names = list(dict.fromkeys([*SORTER_MODULES, *ALL_ALGORITHMS]))
+        self._classes = {}
+
+    def __getitem__(self, name):
+        cls = self._classes.get(name)
+        if cls is None:
+            if name in SORTER_MODULES:
+                module, cls_name = SORTER_MODULES[name]
+                cls = getattr(import_module(f".{module}", __name__), cls_name)
+            elif name in ALL_ALGORITHMS:
+                # Fill unimplemented algorithms with placeholder
+                cls = PlaceholderSorter
+            else:
+                raise KeyError(name)
+            self._classes[name] = cls
+        return cls
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def loaded(self):
+        """Names of the algorithms whose sorter module has been imported."""
+        return [name for name in self._names if name in self._classes]
+
+
+# Map algorithm names to classes
+SORTER_MAP = SorterRegistry()
+
+
+def __getattr__(name):
+    """Import sorter classes such as `from sorting import TimSort` on first access."""
+    if name in _CLASS_NAMES:
+        cls = SORTER_MAP[_CLASS_NAMES[name]]
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_CLASS_NAMES])
+
 
-def get_sorter(name, array):
-    """Factory function to get a sorter instance by name."""
+def get_sorter(name, array, **options):
+    """
+    Factory function to get a sorter instance by name.
+    Extra keyword options are passed to the sorter, e.g. record_steps=False
+    for a metrics-only run or vectorized=True for the NumPy fast path.
+    """
     cls = SORTER_MAP.get(name)
     if not cls:
         raise ValueError(f"Unknown algorithm: {name}")
-    return cls(array)
\ No newline at end of file
+    return cls(array, **options)
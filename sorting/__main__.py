@@ -0,0 +1,201 @@
+# sorting/__main__.py
+"""
+Headless runner: python -m sorting ALGORITHM [ALGORITHM ...] [options]
+
+Sorts a generated array or a data file with each algorithm and prints the
+metrics and timing as one JSON document on stdout. Only the sorting
+package, utils and NumPy are imported (never PyQt6), so it starts quickly
+on servers and in batch jobs. Examples:
+
+    python -m sorting "Quick Sort" "Tim Sort" --size 10000 --distribution nearly_sorted
+    python -m sorting "Radix Sort" --input values.csv --column price --vectorized --no-trace
+    python -m sorting "External Sort" --input values.f64 --mmap --option chunk_size=1000000
+    python -m sorting "Heap Sort" --size 32 --trace heap.jsonl
+"""
+import sys
+import json
+import random
+import argparse
+import inspect
+import time
+import numpy as np
+from . import ALL_ALGORITHMS, SORTER_MAP, get_sorter
+from utils.array_generator import DISTRIBUTIONS, generate_array
+from utils.data_loader import load_array
+
+
+def parse_option(text):
+    """Parse a --option KEY=VALUE pair; VALUE is read as JSON, falling back to a string."""
+    key, sep, value = text.partition('=')
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got {text!r}")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+def accepted_options(cls):
+    """Keyword options a sorter class accepts, collected from every __init__ it chains to."""
+    names = set()
+    for klass in cls.__mro__:
+        init = klass.__dict__.get('__init__')
+        if init is None:
+            continue
+        for param in inspect.signature(init).parameters.values():
+            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
+                names.add(param.name)
+    return names - {'self', 'array'}
+
+
+def run_one(algorithm, array, seed=0, record_steps=True, vectorized=False, repeat=1, options=None):
+    """
+    Sort array with one algorithm and collect its result row.
+
+    The fastest of repeat runs is reported; 'time' is the sorter's own
+    in-algorithm time and 'wall_time' includes step recording. Returns the
+    row and the sorter of the last run (for dumping its trace).
+    """
+    # Algorithms without a vectorized mode run their instrumented path
+    vectorized = vectorized and SORTER_MAP[algorithm].supports_vectorized
+    best = None
+    for _ in range(max(1, repeat)):
+        random.seed(seed)
+        started = time.perf_counter()
+        sorter = get_sorter(algorithm, array, record_steps=record_steps, vectorized=vectorized,
+                            **(options or {}))
+        result = sorter.sort()
+        wall_time = time.perf_counter() - started
+        if best is None or wall_time < best['wall_time']:
+            best = {'wall_time': wall_time, **sorter.get_metrics()}
+
+    result = np.asarray(result)
+    row = {
+        'algorithm': algorithm,
+        'vectorized': vectorized,
+        'sorted': bool(np.all(result[:-1] <= result[1:])),
+        'steps': len(sorter.steps),
+    }
+    row.update(best)
+    return row, sorter
+
+
+def write_trace(sorter, algorithm, f):
+    """Write every recorded step of sorter as one JSON object per line."""
+    for index, step in enumerate(sorter.steps):
+        f.write(json.dumps({
+            'algorithm': algorithm,
+            'step': index,
+            'explanation': step.explanation,
+            'highlights': {kind: [int(i) for i in indices] for kind, indices in step.highlights.items()},
+            'comparisons': step.comparisons,
+            'swaps': step.swaps,
+            'timestamp': step.timestamp,
+            'array': np.asarray(step.array).tolist(),
+        }, default=_to_json))
+        f.write('\n')
+
+
+def _to_json(value):
+    """json.dumps fallback for NumPy scalars and arrays in metrics."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def main(argv=None):
+    """Run the selected algorithms once and print their metrics as JSON"""
+    parser = argparse.ArgumentParser(
+        prog="python -m sorting",
+        description="Run sorting algorithms without the GUI and print metrics as JSON"
+    )
+    parser.add_argument('algorithms', nargs='*', metavar='ALGORITHM',
+                        help="Algorithm names, or 'all' (see --list)")
+    parser.add_argument('--list', action='store_true', help="List the algorithm names and exit")
+    source = parser.add_argument_group("input (generated unless --input is given)")
+    source.add_argument('--size', type=int, default=1000)
+    source.add_argument('--distribution', default="random", choices=DISTRIBUTIONS)
+    source.add_argument('--seed', type=int, default=0,
+                        help="Seed for the input array and for randomized algorithms")
+    source.add_argument('--input', help="Data file to sort (CSV/TSV/text, .npy or raw .i32/.f64)")
+    source.add_argument('--column', help="Column of a multi-column text file (index or header name)")
+    source.add_argument('--mmap', action='store_true', help="Memory-map .npy and raw input files")
+    parser.add_argument('--option', action='append', type=parse_option, default=[], metavar='KEY=VALUE',
+                        help="Sorter option, e.g. --option pivot=ninther (repeatable)")
+    parser.add_argument('--vectorized', action='store_true',
+                        help="Use the NumPy fast path of the sorters that have one")
+    parser.add_argument('--no-trace', action='store_true', help="Metrics-only runs (no step recording)")
+    parser.add_argument('--repeat', type=int, default=1, help="Timed runs per algorithm (fastest is kept)")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="Write the recorded steps to this file as JSON Lines")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print(json.dumps([
+            {'algorithm': name, 'vectorized': SORTER_MAP[name].supports_vectorized}
+            for name in ALL_ALGORITHMS
+        ], indent=2))
+        return 0
+
+    if not args.algorithms:
+        parser.error("no algorithm given (use --list to see the names)")
+    for name in args.algorithms:
+        if name not in SORTER_MAP and args.algorithms != ['all']:
+            parser.error(f"unknown algorithm {name!r} (use --list to see the names)")
+    if args.trace and args.no_trace:
+        parser.error("--trace needs recorded steps; drop --no-trace")
+
+    if args.input:
+        column = int(args.column) if args.column and args.column.lstrip('-').isdigit() else args.column
+        try:
+            array = load_array(args.input, column=column, mmap=args.mmap)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot load {args.input}: {e}")
+        source = {'input': args.input}
+    else:
+        array = generate_array(args.size, args.distribution, seed=args.seed)
+        source = {'distribution': args.distribution, 'seed': args.seed}
+    source.update(size=len(array), dtype=str(array.dtype))
+
+    algorithms = args.algorithms
+    if algorithms == ['all']:
+        # utils.benchmark pulls in multiprocessing, so it is only imported here
+        from utils.benchmark import SIZE_LIMITS
+        algorithms = [name for name in ALL_ALGORITHMS if len(array) <= SIZE_LIMITS.get(name, len(array))]
+
+    options = dict(args.option)
+    accepted = {name: accepted_options(SORTER_MAP[name]) for name in algorithms}
+    unknown = set(options).difference(*accepted.values())
+    if unknown:
+        parser.error(f"no selected algorithm accepts option(s): {', '.join(sorted(unknown))}")
+    results = []
+    trace = open(args.trace, 'w') if args.trace else None
+    try:
+        for name in algorithms:
+            # Each sorter only gets the options it has, e.g. pivot only goes to Quick Sort and IntroSort
+            own = {key: value for key, value in options.items() if key in accepted[name]}
+            try:
+                row, sorter = run_one(name, array, args.seed, record_steps=not args.no_trace,
+                                      vectorized=args.vectorized, repeat=args.repeat, options=own)
+            except (TypeError, ValueError) as e:
+                # Bad option values are reported per algorithm so the others still run
+                results.append({'algorithm': name, 'error': str(e)})
+                continue
+            if len(own) < len(options):
+                row['ignored_options'] = sorted(set(options) - set(own))
+            results.append(row)
+            if trace:
+                write_trace(sorter, name, trace)
+    finally:
+        if trace:
+            trace.close()
+
+    print(json.dumps({'input': source, 'options': options, 'results': results},
+                     indent=2, default=_to_json))
+    return 1 if any('error' in row or not row['sorted'] for row in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
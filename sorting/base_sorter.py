@@ -1,27 +1,65 @@
 # sorting/base_sorter.py
 import time
 from abc import ABC, abstractmethod
+from .step_log import Step, StepLog
 
 class BaseSorter(ABC):
     """
     Abstract base class for all sorting algorithms.
     Ensures consistent step logging, metrics, and visualization support.
+
+    With record_steps=False the sorter runs in metrics-only mode: no steps are
+    stored, but comparisons, swaps and timing are counted exactly as usual,
+    which makes it possible to measure very large inputs.
+
+    Sorters with supports_vectorized = True also accept vectorized=True, which
+    runs sort_vectorized() instead: a whole-array NumPy implementation that
+    returns the same result and sets the same comparison/swap counters as the
+    instrumented path, but only records the initial and final steps.
+
+    The input array is copied unless the sorter sets copy_input = False
+    (External Sort, whose input may be a memory-mapped file larger than RAM).
     """
-    def __init__(self, array):
-        self.original_array = array.copy()
-        self.steps = []  # List of {'array', 'explanation', 'highlights'}
+    supports_vectorized = False
+    copy_input = True
+
+    def __init__(self, array, record_steps=True, vectorized=False):
+        if vectorized and not self.supports_vectorized:
+            raise ValueError(f"{type(self).__name__} has no vectorized mode")
+        self.original_array = array.copy() if self.copy_input else array
+        self.record_steps = record_steps
+        self.vectorized = vectorized
+        self.steps = StepLog()  # Compact, delta-encoded Step records
         self.comparisons = 0
         self.swaps = 0
         self.start_time = None
         self.end_time = None
+        self.elapsed = 0.0  # Seconds spent inside the algorithm itself
+        self.resumed_at = None  # perf_counter() when the algorithm last resumed
+        self.result = None
 
-    def record_step(self, array, explanation="", highlights=None):
-        """Record a step for visualization and playback."""
-        self.steps.append({
-            'array': array.copy(),
-            'explanation': explanation,
-            'highlights': highlights or {}
-        })
+    def record_step(self, array, explanation="", highlights=None, *args, changed=None):
+        """
+        Record a step for visualization and playback (only changed values are stored).
+        explanation may be a str.format template for args, e.g.
+        record_step(arr, "Comparing {} and {}", {'comparing': [i, j]}, arr[i], arr[j]);
+        it is only formatted when the step is displayed.
+        Highlights may use range objects for contiguous runs of indices, or a
+        list of ranges for several runs (stored in O(runs), not O(indices)).
+        changed may list the positions that can differ from the previous step
+        (e.g. () when the array did not change), so long traces over a NumPy
+        display buffer cost O(changed) per step instead of O(n).
+        The step also stores the comparisons, swaps and in-algorithm time so far.
+        Returns the new step index, or None in metrics-only mode.
+        """
+        if not self.record_steps:
+            return None
+        timestamp = self.elapsed
+        if self.resumed_at is not None:
+            timestamp += time.perf_counter() - self.resumed_at
+        self.steps.append(array, explanation, highlights, args,
+                          self.comparisons, self.swaps, timestamp, changed)
+        return len(self.steps) - 1
 
     def compare(self, a, b):
         """Record a comparison and return a > b (for ascending sort)."""
@@ -36,20 +74,58 @@ class BaseSorter(ABC):
 
     def get_metrics(self):
         """Return current performance metrics."""
-        elapsed = (self.end_time or time.time()) - (self.start_time or time.time())
         return {
             'comparisons': self.comparisons,
             'swaps': self.swaps,
-            'time': elapsed
+            'time': self.elapsed
         }
 
     def get_state_at(self, index):
         """Get the state (array + info) at a given step index."""
         if 0 <= index < len(self.steps):
             return self.steps[index]
-        return {'array': self.original_array.copy(), 'explanation': 'Initial state'}
+        return Step(self.original_array.copy(), 'Initial state')
 
-    @abstractmethod
     def sort(self):
-        """Perform the sort and populate self.steps."""
+        """Perform the whole sort, populate self.steps and return the sorted array."""
+        for _ in self.iter_steps():
+            pass
+        return self.result
+
+    def iter_steps(self):
+        """
+        Run the sort lazily, yielding the index of each step as soon as it is recorded.
+        Only time spent inside the algorithm counts towards the 'time' metric, so
+        consumers may pause between steps without skewing it.
+        """
+        steps = self.vectorized_steps() if self.vectorized else self.sort_steps()
+        self.start_time = time.time()
+        while True:
+            self.resumed_at = time.perf_counter()
+            try:
+                index = next(steps)
+            except StopIteration as done:
+                self.result = done.value
+                break
+            finally:
+                self.elapsed += time.perf_counter() - self.resumed_at
+                self.resumed_at = None
+            yield index
+        self.end_time = time.time()
+
+    def vectorized_steps(self):
+        """Step generator wrapping sort_vectorized(): records only the start and the result."""
+        arr = self.original_array.copy()
+        yield self.record_step(arr, "Start (vectorized NumPy path)")
+        result = self.sort_vectorized(arr)
+        yield self.record_step(result, "Sorting completed!")
+        return result
+
+    def sort_vectorized(self, arr):
+        """Sort arr with whole-array NumPy operations, updating the counters. Optional."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def sort_steps(self):
+        """Generator that performs the sort, yields after every recorded step and returns the sorted array."""
         pass
\ No newline at end of file
@@ -1,5 +1,4 @@
 # sorting/bogo_sort.py
-import time
 import random
 from .base_sorter import BaseSorter
 
@@ -15,20 +14,18 @@ class BogoSort(BaseSorter):
     ⚠️ WARNING: This algorithm has O(n!) average time complexity.
     Only use for arrays with n <= 8!
     """
-    def sort(self):
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Bogo Sort (Random Shuffle Until Sorted)")
+        yield self.record_step(arr, "Start Bogo Sort (Random Shuffle Until Sorted)")
 
         if n <= 1:
-            self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
-            self.end_time = time.time()
+            yield self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
             return arr
 
         if n > 8:
-            self.record_step(
+            yield self.record_step(
                 arr,
                 "⚠️ Bogo Sort is EXTREMELY SLOW for n > 8!\n"
                 "Consider using a real sorting algorithm instead."
@@ -40,9 +37,11 @@ class BogoSort(BaseSorter):
         while not self._is_sorted(arr):
             attempts += 1
             if attempts > max_attempts:
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"⚠️ Gave up after {max_attempts} attempts! Array may never sort randomly."
+                    "⚠️ Gave up after {} attempts! Array may never sort randomly.",
+                    None,
+                    max_attempts
                 )
                 break
 
@@ -51,17 +50,17 @@ class BogoSort(BaseSorter):
             self.swaps += n  # Count as n swaps (full shuffle)
             
             if attempts % 100 == 0 or attempts <= 10:
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"Attempt {attempts}: Random shuffle",
-                    {'comparing': list(range(n))}
+                    "Attempt {}: Random shuffle",
+                    {'comparing': range(n)},
+                    attempts
                 )
 
-        self.end_time = time.time()
         if self._is_sorted(arr):
-            self.record_step(arr, f"Bogo Sort completed in {attempts} attempts! 🎉")
+            yield self.record_step(arr, "Bogo Sort completed in {} attempts! 🎉", None, attempts)
         else:
-            self.record_step(arr, "Bogo Sort failed to sort within attempt limit.")
+            yield self.record_step(arr, "Bogo Sort failed to sort within attempt limit.")
         return arr
 
     def _is_sorted(self, arr):
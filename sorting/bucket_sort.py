@@ -1,91 +1,255 @@
 # sorting/bucket_sort.py
-import time
+import numpy as np
 from .base_sorter import BaseSorter
+from .introsort import IntroSort
 
 class BucketSort(BaseSorter):
     """
     Bucket Sort Algorithm
     
     Steps:
-    1. Create n empty buckets
+    1. Create the buckets
     2. Put array elements in different buckets based on value
     3. Sort individual buckets (using Insertion Sort)
     4. Concatenate all buckets into sorted array
+
+    Options:
+        adaptive (bool): Place bucket boundaries on the empirical distribution
+            of an evenly spaced sample instead of splitting the value range
+            evenly, size the bucket count by the distinct values seen, and sort
+            overloaded buckets with IntroSort instead of Insertion Sort, so
+            skewed inputs do not degrade to quadratic time. On by default.
+        numpy_distribution (bool): Scatter the values into their buckets with
+            one stable argsort instead of element by element (recording a
+            single step for the whole distribution).
+
+    After sorting, get_metrics() also reports the bucket count, a histogram of
+    bucket sizes and the number of overloaded buckets.
     """
-    def sort(self):
+    supports_vectorized = True
+
+    SAMPLE_SIZE = 256  # Values sampled to estimate the distribution
+    OVERLOAD_MIN = 32  # Buckets up to this size always use Insertion Sort
+    OVERLOAD_FACTOR = 8  # Overloaded: more than this many times the mean bucket size
+
+    def __init__(self, array, adaptive=True, numpy_distribution=False, **options):
+        super().__init__(array, **options)
+        self.adaptive = adaptive
+        self.numpy_distribution = numpy_distribution
+        self.bucket_sizes = None  # Size of every bucket, once distributed
+        self.overloaded_buckets = 0
+
+    def get_metrics(self):
+        metrics = super().get_metrics()
+        if self.bucket_sizes is not None:
+            sizes, counts = np.unique(self.bucket_sizes, return_counts=True)
+            metrics['bucket_count'] = len(self.bucket_sizes)
+            metrics['bucket_size_histogram'] = dict(zip(sizes.tolist(), counts.tolist()))
+            metrics['overloaded_buckets'] = self.overloaded_buckets
+        return metrics
+
+    def _assign_buckets(self, arr):
+        """
+        Return (bucket index of every value, bucket count). Both the instrumented
+        and the vectorized path use this, so values always land in the same bucket.
+        """
+        arr = np.asarray(arr)
+        n = len(arr)
+        min_val = arr.min()
+        max_val = arr.max()
+        if not self.adaptive:
+            range_val = max_val - min_val if max_val != min_val else 1
+            # Avoid index = n when value == max_val
+            return np.minimum(((arr - min_val) / range_val * n).astype(np.int64), n - 1), n
+
+        # Empirical CDF of the sample, interpolated between sampled values
+        picks = np.linspace(0, n - 1, min(n, self.SAMPLE_SIZE)).astype(np.intp)
+        sample = np.sort(np.concatenate((arr[picks], [min_val, max_val])))
+        values, first = np.unique(sample, return_index=True)
+        # Duplicates in the sample mean fewer distinct values, so fewer buckets
+        bucket_count = max(1, min(n, len(values) * n // len(sample)))
+        cdf = np.interp(arr, values, first / (len(sample) - 1))
+        return np.minimum((cdf * bucket_count).astype(np.int64), bucket_count - 1), bucket_count
+
+    def _overload_limit(self, n, bucket_count):
+        """Largest bucket still sorted with Insertion Sort (unbounded unless adaptive)."""
+        if not self.adaptive:
+            return n
+        return max(self.OVERLOAD_MIN, self.OVERLOAD_FACTOR * n // bucket_count)
+
+    def _introsort_bucket(self, bucket):
+        """Sort one bucket with IntroSort, adding its counters to ours."""
+        sorter = IntroSort(np.array(bucket), record_steps=False)
+        result = sorter.sort()
+        self.comparisons += sorter.comparisons
+        self.swaps += sorter.swaps
+        return list(result)
+
+    def sort_vectorized(self, arr):
+        """
+        Distribute with array arithmetic and a stable argsort, then derive the
+        insertion sort counters of every bucket without running it. Insertion
+        sort shifts each element past the larger elements before it, so a
+        bucket of size m costs (inversions + m - 1) swaps and the same number
+        of comparisons minus the elements that are strict prefix minima (those
+        run off the front of the bucket without a final, failing comparison).
+        Overloaded buckets are few and run through IntroSort as usual.
+        """
+        n = len(arr)
+        if n <= 1:
+            return arr
+
+        bucket_index, bucket_count = self._assign_buckets(arr)
+        order = np.argsort(bucket_index, kind='stable')
+        buckets = bucket_index[order]
+        values = arr[order]  # Bucket contents in insertion order
+
+        self.bucket_sizes = np.bincount(bucket_index, minlength=bucket_count)
+        starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+        ends = np.append(starts[1:], n)
+        overloaded = ((ends - starts > self._overload_limit(n, bucket_count))
+                      & (np.maximum.reduceat(values, starts) > np.minimum.reduceat(values, starts)))
+        self.overloaded_buckets = int(np.count_nonzero(overloaded))
+        for start, end in zip(starts[overloaded].tolist(), ends[overloaded].tolist()):
+            self._introsort_bucket(values[start:end])
+
+        # Insertion-sorted buckets only from here on
+        insertion = ~np.repeat(overloaded, ends - starts)
+        buckets = buckets[insertion]
+        m = len(buckets)
+        if m == 0:
+            return np.sort(values, kind='stable')
+
+        # Ranks (ties share a rank) make the inversion count integer-only
+        ranks = np.unique(values[insertion], return_inverse=True)[1].ravel().astype(np.int64)
+        inversions = _bucket_inversions(buckets, ranks)
+
+        # Bucket-major offsets restart the running minimum at every bucket
+        keys = ranks - buckets * m
+        running_min = np.minimum.accumulate(keys)
+        new_minima = int(np.count_nonzero(keys[1:] < running_min[:-1]))
+        bucket_starts = int(np.count_nonzero(np.diff(buckets))) + 1
+        shifts_and_inserts = inversions + m - bucket_starts
+
+        self.swaps += shifts_and_inserts
+        self.comparisons += shifts_and_inserts - (new_minima - (bucket_starts - 1))
+        return np.sort(values, kind='stable')
+
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Bucket Sort")
+        yield self.record_step(arr, "Start Bucket Sort")
 
         if n <= 1:
-            self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
-            self.end_time = time.time()
+            yield self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
             return arr
 
-        # Handle any range by normalizing to [0, 1)
-        min_val = min(arr)
-        max_val = max(arr)
-        range_val = max_val - min_val if max_val != min_val else 1
+        if self.adaptive:
+            yield self.record_step(
+                arr,
+                "Sampling {} values to place bucket boundaries on the value distribution",
+                None,
+                min(n, self.SAMPLE_SIZE)
+            )
+        else:
+            yield self.record_step(
+                arr,
+                "Input range: [{:.2f}, {:.2f}] → Normalizing to [0, 1)",
+                None,
+                min(arr), max(arr)
+            )
 
-        self.record_step(
-            arr,
-            f"Input range: [{min_val:.2f}, {max_val:.2f}] → Normalizing to [0, 1)"
-        )
+        bucket_index, bucket_count = self._assign_buckets(arr)
+        limit = self._overload_limit(n, bucket_count)
+        values = np.asarray(arr).tolist()
 
-        # Create n empty buckets
-        buckets = [[] for _ in range(n)]
-        self.record_step(arr, f"Created {n} empty buckets")
+        # Create the empty buckets
+        yield self.record_step(arr, "Created {} empty buckets", None, bucket_count)
 
         # Distribute input array values into buckets
-        for i, value in enumerate(arr):
-            # Normalize value to [0, 1)
-            normalized = (value - min_val) / range_val
-            # Avoid index = n when value == max_val
-            bucket_index = min(int(normalized * n), n - 1)
-            buckets[bucket_index].append(value)
-            
-            self.record_step(
+        if self.numpy_distribution:
+            order = np.argsort(bucket_index, kind='stable')
+            bounds = np.cumsum(np.bincount(bucket_index, minlength=bucket_count))[:-1]
+            buckets = [bucket.tolist() for bucket in np.split(np.asarray(arr)[order], bounds)]
+            yield self.record_step(
                 arr,
-                f"Distributed {value:.2f} into bucket {bucket_index}",
-                {'comparing': [i]}
+                "Distributed {} values into {} buckets with NumPy",
+                None,
+                n, bucket_count
             )
+        else:
+            buckets = [[] for _ in range(bucket_count)]
+            for i, (value, index) in enumerate(zip(values, bucket_index.tolist())):
+                buckets[index].append(value)
+
+                yield self.record_step(
+                    arr,
+                    "Distributed {:.2f} into bucket {}",
+                    {'comparing': [i]},
+                    value, index,
+                    changed=()
+                )
 
-        # Show bucket distribution
-        bucket_summary = [f"Bucket {i}: {len(b)} items" for i, b in enumerate(buckets) if b]
-        self.record_step(
-            arr,
-            "Bucket distribution:\n" + "\n".join(bucket_summary)
-        )
+        self.bucket_sizes = np.array([len(b) for b in buckets])
+
+        # Show bucket distribution (one line per bucket, so only built when tracing)
+        if self.record_steps:
+            yield self.record_step(
+                arr,
+                "Bucket distribution:\n" + "\n".join(
+                    f"Bucket {i}: {size} items" for i, size in enumerate(self.bucket_sizes.tolist()) if size
+                )
+            )
 
-        # Sort individual buckets and concatenate
+        # Sort individual buckets and concatenate. The display buffer holds
+        # the sorted buckets followed by the unsorted rest; sorting a bucket
+        # only rewrites its own slice, so tracing stays O(n + k)
+        display = np.asarray([x for b in buckets for x in b], dtype=arr.dtype)
         sorted_arr = []
+        first = True
         for i, bucket in enumerate(buckets):
+            start = len(sorted_arr)
             if bucket:
-                self.record_step(
-                    sorted_arr + bucket + [x for b in buckets[i+1:] for x in b],
-                    f"Sorting bucket {i} with {len(bucket)} elements",
-                    {'comparing': list(range(len(sorted_arr), len(sorted_arr) + len(bucket)))}
+                overloaded = len(bucket) > limit and max(bucket) > min(bucket)
+                yield self.record_step(
+                    display,
+                    "Bucket {} is overloaded ({} elements): sorting it with IntroSort" if overloaded
+                    else "Sorting bucket {} with {} elements",
+                    {'comparing': range(start, start + len(bucket))},
+                    i, len(bucket),
+                    changed=None if first else ()
                 )
-                
-                # Sort bucket using Insertion Sort logic (in-place)
-                bucket_sorted = self._insertion_sort_bucket(bucket)
+                first = False
+
+                if overloaded:
+                    self.overloaded_buckets += 1
+                    bucket_sorted = self._introsort_bucket(bucket)
+                else:
+                    # Sort bucket using Insertion Sort logic (in-place)
+                    bucket_sorted = self._insertion_sort_bucket(bucket)
                 sorted_arr.extend(bucket_sorted)
-                
-                self.record_step(
-                    sorted_arr + [x for b in buckets[i+1:] for x in b],
-                    f"Bucket {i} sorted: {bucket_sorted}",
-                    {'sorted': list(range(len(sorted_arr) - len(bucket_sorted), len(sorted_arr)))}
+                if self.record_steps:
+                    display[start:len(sorted_arr)] = bucket_sorted
+
+                yield self.record_step(
+                    display,
+                    "Bucket {} sorted: {}",
+                    {'sorted': range(start, len(sorted_arr))},
+                    i, bucket_sorted,
+                    changed=range(start, len(sorted_arr))
                 )
             else:
-                self.record_step(
-                    sorted_arr + [x for b in buckets[i+1:] for x in b],
-                    f"Bucket {i} is empty"
+                yield self.record_step(
+                    display,
+                    "Bucket {} is empty",
+                    None,
+                    i,
+                    changed=None if first else ()
                 )
+                first = False
 
-        self.end_time = time.time()
-        self.record_step(sorted_arr, "Bucket Sort completed!")
+        yield self.record_step(sorted_arr, "Bucket Sort completed!")
         return sorted_arr
 
     def _insertion_sort_bucket(self, bucket):
@@ -100,4 +264,47 @@ class BucketSort(BaseSorter):
                 self.swaps += 1
             arr[j + 1] = key
             self.swaps += 1
-        return arr
\ No newline at end of file
+        return arr
+
+
+def _bucket_inversions(buckets, ranks):
+    """
+    Count pairs i < j in the same bucket with ranks[i] > ranks[j].
+    buckets must be grouped (non-decreasing). Bottom-up merge counting: at
+    each level every element of a right half counts the larger elements of
+    its left half with a binary search, so the work is O(n log n) per level
+    and only log2(largest bucket) levels are needed.
+    """
+    if len(ranks) < 2:
+        return 0
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    # Buckets holding a single distinct value have no inversions; drop them
+    mixed = np.maximum.reduceat(ranks, starts) > np.minimum.reduceat(ranks, starts)
+    if not mixed.any():
+        return 0
+    sizes = np.diff(np.append(starts, len(ranks)))
+    keep = np.repeat(mixed, sizes)
+    buckets, ranks = buckets[keep], ranks[keep]
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+
+    n = len(ranks)
+    sizes = np.diff(np.append(starts, n))
+    position = np.arange(n) - np.repeat(starts, sizes)  # Index within the bucket
+    span = int(ranks.max()) + 1  # Rank stride for the (chunk, rank) search keys
+
+    inversions = 0
+    width = 1
+    while width < sizes.max():
+        chunk = position // width
+        # Consecutive ids for the width-sized chunks of every bucket
+        chunk_id = np.cumsum(np.concatenate(([0], (chunk[1:] != chunk[:-1]) | (buckets[1:] != buckets[:-1]))))
+        left = chunk % 2 == 0
+        left_keys = np.sort(chunk_id[left] * span + ranks[left])
+        right = ~left
+        # A right chunk's partner is the chunk just before it in the same bucket
+        partner = (chunk_id[right] - 1) * span
+        larger = (np.searchsorted(left_keys, partner + span, 'left')
+                  - np.searchsorted(left_keys, partner + ranks[right], 'right'))
+        inversions += int(larger.sum())
+        width *= 2
+    return inversions
@@ -1,5 +1,4 @@
 # sorting/comb_sort.py
-import time
 from .base_sorter import BaseSorter
 
 class CombSort(BaseSorter):
@@ -15,16 +14,14 @@ class CombSort(BaseSorter):
         c. Compare and swap elements gap apart
         d. Record if any swaps occurred
     """
-    def sort(self):
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Comb Sort")
+        yield self.record_step(arr, "Start Comb Sort")
 
         if n <= 1:
-            self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
-            self.end_time = time.time()
+            yield self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
             return arr
 
         gap = n
@@ -42,34 +39,36 @@ class CombSort(BaseSorter):
             swapped = False
             pass_num += 1
 
-            self.record_step(
+            yield self.record_step(
                 arr,
-                f"Pass {pass_num}: Gap = {gap}",
-                {'comparing': list(range(n - gap))}
+                "Pass {}: Gap = {}",
+                {'comparing': range(n - gap)},
+                pass_num, gap
             )
 
             # Compare elements gap apart
             for i in range(n - gap):
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"Comparing {arr[i]} and {arr[i + gap]} (gap={gap})",
-                    {'comparing': [i, i + gap]}
+                    "Comparing {} and {} (gap={})",
+                    {'comparing': [i, i + gap]},
+                    arr[i], arr[i + gap], gap
                 )
                 if self.compare(arr[i], arr[i + gap]):
                     self.swap(arr, i, i + gap)
                     swapped = True
-                    self.record_step(
+                    yield self.record_step(
                         arr,
-                        f"Swapped {arr[i]} and {arr[i + gap]}",
-                        {'swapping': [i, i + gap]}
+                        "Swapped {} and {}",
+                        {'swapping': [i, i + gap]},
+                        arr[i], arr[i + gap]
                     )
 
             if gap == 1 and not swapped:
-                self.record_step(
+                yield self.record_step(
                     arr,
                     "No swaps with gap=1. Array is sorted."
                 )
 
-        self.end_time = time.time()
-        self.record_step(arr, "Comb Sort completed!")
+        yield self.record_step(arr, "Comb Sort completed!")
         return arr
\ No newline at end of file
@@ -1,8 +1,9 @@
 # sorting/counting_sort.py
-import time
-from .base_sorter import BaseSorter
+import numpy as np
+from .sparse import SparseRangeSorter, radix_sorted
 
-class CountingSort(BaseSorter):
+
+class CountingSort(SparseRangeSorter):
     """
     Counting Sort Algorithm
     
@@ -11,17 +12,43 @@ class CountingSort(BaseSorter):
     2. Create a count array to store frequency of each element
     3. Modify count array to store cumulative counts
     4. Build output array by placing elements at correct positions
+
+    When the value range k is much larger than n, frequencies are kept in a
+    dict instead of a count array (sparse counting, see SparseRangeSorter
+    for the mode option).
     """
-    def sort(self):
+    supports_vectorized = True
+
+    def __init__(self, array, **options):
+        super().__init__(array, **options)
+        self.counting_mode = None  # 'dense' or 'sparse', set once the sort has run
+
+    def sort_vectorized(self, arr):
+        """np.bincount histogram expanded with np.repeat; like sort_steps, values are truncated to int."""
+        if len(arr) == 0:
+            return arr
+        min_val = int(arr.min())
+        shift = -min_val if min_val < 0 else 0
+        # Shifting before truncating matches sort_steps for negative floats
+        keys = (arr + shift).astype(np.int64) if shift else arr.astype(np.int64)
+        low = int(keys.min())
+        k = int(keys.max()) - low + 1
+        if self.use_sparse(k, len(arr)):
+            self.counting_mode = 'sparse'
+            values, count = np.unique(keys, return_counts=True)
+            return np.repeat(values - shift, count)
+        self.counting_mode = 'dense'
+        count = np.bincount(keys - low)
+        return np.repeat(np.arange(low, low + len(count), dtype=np.int64) - shift, count)
+
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Counting Sort")
+        yield self.record_step(arr, "Start Counting Sort")
 
         if n == 0:
-            self.record_step(arr, "Empty array. Sorting complete!")
-            self.end_time = time.time()
+            yield self.record_step(arr, "Empty array. Sorting complete!")
             return arr
 
         # Only works for non-negative integers
@@ -29,55 +56,98 @@ class CountingSort(BaseSorter):
         max_val = int(max(arr))
         
         if min_val < 0:
-            self.record_step(
+            yield self.record_step(
                 arr,
-                f"⚠️ Counting Sort requires non-negative integers. Found min={min_val}."
+                "⚠️ Counting Sort requires non-negative integers. Found min={}.",
+                None,
+                min_val
             )
             # Shift all values to be non-negative
             shift = -min_val
-            arr = [x + shift for x in arr]
+            arr = arr + shift
             min_val = 0
             max_val = int(max(arr))
-            self.record_step(
+            yield self.record_step(
                 arr,
-                f"Shifted all values by +{shift} to make them non-negative."
+                "Shifted all values by +{} to make them non-negative.",
+                None,
+                shift
             )
 
         k = max_val - min_val + 1  # Range of input
-        self.record_step(
+        yield self.record_step(
             arr,
-            f"Input range: [{min_val}, {max_val}] → k = {k}"
+            "Input range: [{}, {}] → k = {}",
+            None,
+            min_val, max_val, k
         )
 
+        if self.use_sparse(k, n):
+            self.counting_mode = 'sparse'
+            yield self.record_step(
+                arr,
+                "Sparse counting mode (k = {}, n = {}): frequencies go into a hash map "
+                "and only the distinct values are ordered",
+                None,
+                k, n
+            )
+            output = yield from self._sparse_counting(arr)
+        else:
+            self.counting_mode = 'dense'
+            yield self.record_step(arr, "Dense counting mode: count array of size k = {}", None, k)
+            output = yield from self._dense_counting(arr, min_val, k)
+
+        # If we shifted values earlier, shift back
+        if min_val != int(min(self.original_array)):
+            shift = min_val - int(min(self.original_array))
+            output = output - shift
+            yield self.record_step(
+                output,
+                "Shifted values back by {}",
+                None,
+                -shift
+            )
+
+        yield self.record_step(output, "Counting Sort completed!")
+        return output
+
+    def _dense_counting(self, arr, min_val, k):
+        """Classic counting sort with a count array of size k. Returns the output array."""
+        n = len(arr)
+
         # Step 1: Count frequencies
         count = [0] * k
-        self.record_step(arr, "Counting frequencies of each element...")
+        yield self.record_step(arr, "Counting frequencies of each element...")
         
         for i, num in enumerate(arr):
             idx = int(num) - min_val
             count[idx] += 1
             # Highlight current element being counted
-            self.record_step(
+            yield self.record_step(
                 arr,
-                f"Counted {num} (index {idx} in count array)",
-                {'comparing': [i]}
+                "Counted {} (index {} in count array)",
+                {'comparing': [i]},
+                num, idx,
+                changed=()
             )
 
-        self.record_step(arr, f"Frequency array: {count}")
+        yield self.record_step(arr, "Frequency array: {}", None, list(count))
 
         # Step 2: Cumulative count (positions)
-        self.record_step(arr, "Computing cumulative counts (positions)...")
+        yield self.record_step(arr, "Computing cumulative counts (positions)...")
         for i in range(1, k):
             count[i] += count[i - 1]
-            self.record_step(
+            yield self.record_step(
                 arr,
-                f"Cumulative count at index {i}: {count[i]}",
-                {'comparing': []}
+                "Cumulative count at index {}: {}",
+                {'comparing': []},
+                i, count[i],
+                changed=()
             )
 
-        # Step 3: Build output array (stable sort)
-        output = [0] * n
-        self.record_step(arr, "Building output array from back to front (for stability)...")
+        # Step 3: Build output array (stable sort); each step writes one position
+        output = np.zeros(n, dtype=np.int64)
+        yield self.record_step(arr, "Building output array from back to front (for stability)...")
 
         for i in range(n - 1, -1, -1):
             num = int(arr[i])
@@ -86,21 +156,61 @@ class CountingSort(BaseSorter):
             output[pos] = num
             count[idx] -= 1
             
-            self.record_step(
+            yield self.record_step(
                 output,
-                f"Placed {num} at position {pos}",
-                {'swapping': [pos]}
+                "Placed {} at position {}",
+                {'swapping': [pos]},
+                num, pos,
+                changed=None if i == n - 1 else (pos,)
             )
 
-        # If we shifted values earlier, shift back
-        if min_val != int(min(self.original_array)):
-            shift = min_val - int(min(self.original_array))
-            output = [x - shift for x in output]
-            self.record_step(
+        return output
+
+    def _sparse_counting(self, arr):
+        """Counting sort over the distinct values only (coordinate compression). Returns the output array."""
+        n = len(arr)
+
+        # Step 1: Count frequencies in a hash map
+        count = {}
+        yield self.record_step(arr, "Counting frequencies of each element...")
+        for i, num in enumerate(arr):
+            key = int(num)
+            count[key] = count.get(key, 0) + 1
+            yield self.record_step(
+                arr,
+                "Counted {} ({} distinct values so far)",
+                {'comparing': [i]},
+                num, len(count),
+                changed=()
+            )
+
+        # Step 2: Order the distinct values, then turn counts into positions
+        base = min(count)
+        distinct = [key + base for key in radix_sorted([key - base for key in count])]
+        yield self.record_step(arr, "Ordered the {} distinct values", None, len(distinct))
+
+        total = 0
+        for key in distinct:
+            total += count[key]
+            count[key] = total
+        yield self.record_step(arr, "Computed cumulative counts (positions) for the distinct values")
+
+        # Step 3: Build output array (stable sort); each step writes one position
+        output = np.zeros(n, dtype=np.int64)
+        yield self.record_step(arr, "Building output array from back to front (for stability)...")
+
+        for i in range(n - 1, -1, -1):
+            num = int(arr[i])
+            pos = count[num] - 1  # Position in output
+            output[pos] = num
+            count[num] -= 1
+
+            yield self.record_step(
                 output,
-                f"Shifted values back by {-shift}"
+                "Placed {} at position {}",
+                {'swapping': [pos]},
+                num, pos,
+                changed=None if i == n - 1 else (pos,)
             )
 
-        self.end_time = time.time()
-        self.record_step(output, "Counting Sort completed!")
         return output
\ No newline at end of file
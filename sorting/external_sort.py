@@ -0,0 +1,202 @@
+# sorting/external_sort.py
+import heapq
+import tempfile
+import numpy as np
+from .base_sorter import BaseSorter
+
+
+class ExternalSort(BaseSorter):
+    """
+    External Merge Sort (for datasets larger than RAM)
+
+    Steps:
+    1. Read the input chunk by chunk, sort every chunk in memory with an
+       existing sorter and write it to a scratch file as a sorted run
+    2. Merge all runs in one k-way pass: a heap keyed by the last value in
+       every run's read buffer names the buffer that runs out first; all
+       buffered values up to that key are merged and written as one block,
+       and the exhausted buffer is refilled
+
+    The input may be a np.memmap (see utils.data_loader.load_array(...,
+    mmap=True)); it is never copied into memory. Memory use is bounded by
+    one chunk (plus the run sorter's working arrays) during run generation
+    and by (runs + 1) * buffer_size values during the merge. The result is
+    a np.memmap over the output file.
+
+    Options:
+        chunk_size (int): Values per sorted run.
+        buffer_size (int): Values read ahead per run during the merge.
+        run_algorithm (str): Sorter for the runs, 'Radix Sort' by default.
+        run_vectorized (bool): Use the run sorter's NumPy path if it has one.
+        run_options (dict, optional): Options for the run sorter; Radix Sort
+            uses base 65536 by default, which needs a quarter of the passes.
+        output_path (str, optional): Where to write the sorted values;
+            an anonymous temporary file by default.
+
+    Steps are recorded per run and per merged chunk only, and show an evenly
+    spaced sample of at most PREVIEW_SIZE values instead of the full data.
+    Comparisons and swaps are those of the run sorter plus one move per
+    value written by the merge (whose comparisons happen inside NumPy).
+    """
+    copy_input = False
+    PREVIEW_SIZE = 1024
+    DEFAULT_RUN_OPTIONS = {"Radix Sort": {'base': 1 << 16}}
+
+    def __init__(self, array, chunk_size=1 << 20, buffer_size=1 << 16, run_algorithm="Radix Sort",
+                 run_vectorized=True, run_options=None, output_path=None, **options):
+        super().__init__(array, **options)
+        from . import SORTER_MAP  # Imported here since the registry itself imports this module
+        if chunk_size < 2 or buffer_size < 1:
+            raise ValueError("External Sort needs chunk_size >= 2 and buffer_size >= 1")
+        if run_algorithm not in SORTER_MAP or SORTER_MAP[run_algorithm] is type(self):
+            raise ValueError(f"Unknown run algorithm: {run_algorithm}")
+        self.chunk_size = chunk_size
+        self.buffer_size = buffer_size
+        self.run_sorter = SORTER_MAP[run_algorithm]
+        self.run_algorithm = run_algorithm
+        self.run_vectorized = run_vectorized and self.run_sorter.supports_vectorized
+        self.run_options = self.DEFAULT_RUN_OPTIONS.get(run_algorithm, {}) if run_options is None else run_options
+        self.output_path = output_path
+        self.runs = 0
+        self.merge_rounds = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def get_metrics(self):
+        metrics = super().get_metrics()
+        metrics['runs'] = self.runs
+        metrics['merge_rounds'] = self.merge_rounds
+        metrics['bytes_read'] = self.bytes_read
+        metrics['bytes_written'] = self.bytes_written
+        return metrics
+
+    def sort_steps(self):
+        data = self.original_array
+        if not isinstance(data, np.ndarray):
+            data = np.asarray(data)
+        n = len(data)
+        itemsize = data.dtype.itemsize
+        samples = np.linspace(0, n - 1, min(n, self.PREVIEW_SIZE)).astype(np.intp)
+
+        yield self.record_step(
+            data[samples],
+            "Start External Sort: {} values ({:.1f} MB), runs of {} sorted with {}",
+            None,
+            n, n * itemsize / 1e6, self.chunk_size, self.run_algorithm
+        )
+
+        if n <= 1:
+            yield self.record_step(data[samples], "Array has 0 or 1 element. Already sorted!")
+            return np.array(data)
+
+        # Phase 1: sorted runs, written one after another into a scratch file
+        runs_file = np.memmap(tempfile.TemporaryFile(), dtype=data.dtype, mode='w+', shape=(n,))
+        runs = []
+        for start in range(0, n, self.chunk_size):
+            stop = min(start + self.chunk_size, n)
+            chunk = np.array(data[start:stop])
+            self.bytes_read += chunk.nbytes
+            runs_file[start:stop] = self._sort_run(chunk)
+            self.bytes_written += chunk.nbytes
+            runs.append((start, stop))
+            self.runs += 1
+            if self.record_steps:
+                yield self.record_step(
+                    self._preview(samples, runs_file, data, stop),
+                    "Run {}: sorted [{}:{}] in memory and wrote it to the run file",
+                    {'sorted': self._preview_range(samples, start, stop)},
+                    len(runs), start, stop
+                )
+
+        # Phase 2: one k-way merge of all runs into the output file
+        if self.output_path is None:
+            output = np.memmap(tempfile.TemporaryFile(), dtype=data.dtype, mode='w+', shape=(n,))
+        else:
+            output = np.memmap(self.output_path, dtype=data.dtype, mode='w+', shape=(n,))
+        yield self.record_step(
+            self._preview(samples, runs_file, data, n),
+            "Merging {} runs with {}-value read buffers",
+            None,
+            len(runs), self.buffer_size
+        )
+
+        written = 0
+        next_step = self.chunk_size
+        for block in self._merge_blocks(runs_file, runs):
+            output[written:written + len(block)] = block
+            written += len(block)
+            self.swaps += len(block)
+            self.bytes_written += block.nbytes
+            if self.record_steps and (written >= next_step or written == n):
+                next_step = written + self.chunk_size
+                yield self.record_step(
+                    self._preview(samples, output, runs_file, written),
+                    "Merged {} of {} values ({} merge rounds)",
+                    {'sorted': self._preview_range(samples, 0, written)},
+                    written, n, self.merge_rounds
+                )
+
+        output.flush()
+        del runs_file  # Closes and frees the scratch file
+        yield self.record_step(output[samples], "External Sort completed!")
+        return output
+
+    def _sort_run(self, chunk):
+        sorter = self.run_sorter(chunk, record_steps=False, vectorized=self.run_vectorized, **self.run_options)
+        result = sorter.sort()
+        self.comparisons += sorter.comparisons
+        self.swaps += sorter.swaps
+        return np.asarray(result, dtype=chunk.dtype)
+
+    def _merge_blocks(self, runs_file, runs):
+        """Yield the merged output of all runs as a sequence of sorted blocks."""
+        buffers = []
+        positions = []  # Next unread index of every run
+        versions = [0] * len(runs)
+        heap = []  # (last buffered value, run, version); stale versions are skipped
+
+        def refill(r):
+            start = positions[r]
+            stop = min(start + self.buffer_size, runs[r][1])
+            buffers[r] = np.array(runs_file[start:stop])
+            positions[r] = stop
+            self.bytes_read += buffers[r].nbytes
+            versions[r] += 1
+            if len(buffers[r]):
+                heapq.heappush(heap, (buffers[r][-1], r, versions[r]))
+
+        for r, (start, _) in enumerate(runs):
+            buffers.append(None)
+            positions.append(start)
+            refill(r)
+
+        while heap:
+            bound, r, version = heapq.heappop(heap)
+            if version != versions[r]:
+                continue
+            # Every buffered value <= bound precedes everything not yet output
+            pieces = []
+            for other, buffer in enumerate(buffers):
+                if len(buffer) == 0:
+                    continue
+                take = len(buffer) if other == r else int(np.searchsorted(buffer, bound, 'right'))
+                if take:
+                    pieces.append(buffer[:take])
+                    buffers[other] = buffer[take:]
+            block = np.concatenate(pieces)
+            # The pieces are sorted runs, which NumPy's stable sort merges
+            block.sort(kind='stable')
+            self.merge_rounds += 1
+            yield block
+
+            for other, buffer in enumerate(buffers):
+                if len(buffer) == 0:
+                    refill(other)
+
+    def _preview(self, samples, front, back, boundary):
+        """Sampled values: positions below boundary from front, the rest from back."""
+        return np.where(samples < boundary, front[samples], back[samples])
+
+    def _preview_range(self, samples, start, stop):
+        """Preview bars whose sampled positions fall in [start, stop)."""
+        return range(int(np.searchsorted(samples, start)), int(np.searchsorted(samples, stop)))
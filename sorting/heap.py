@@ -0,0 +1,140 @@
+# sorting/heap.py
+"""
+Max-heap primitives shared by Heap Sort and IntroSort's heap sort fallback.
+
+The heap occupies arr[low:low + size]; node k has children arity*k + 1 ..
+arity*k + arity (relative to low). Comparisons and swaps are counted on the
+sorter passed in. Every function is a step generator like the sorters'
+helpers: with trace=True it records its moves through sorter.record_step,
+otherwise it yields nothing and is driven with `yield from` all the same.
+
+sift_down is the textbook sift-down: each level compares the node with all
+of its children (arity comparisons). sift_down_bottom_up is Floyd's
+bottom-up variant: it follows the larger children to a leaf without
+comparing against the sifted value (arity - 1 comparisons per level), then
+climbs back up to where the value belongs. Values sifted during extraction
+come from the bottom of the heap and rarely climb far, so this saves close
+to half the comparisons of a binary heap sort.
+"""
+
+HEAP_NAMES = {2: "binary", 3: "ternary", 4: "quaternary"}
+
+
+def check_arity(arity):
+    if arity < 2:
+        raise ValueError("A heap needs an arity of at least 2")
+
+
+def heap_name(arity):
+    return HEAP_NAMES.get(arity, f"{arity}-ary")
+
+
+def sift_down(sorter, arr, low, root, size, arity=2, trace=False):
+    """Sift arr[low + root] down until it is no smaller than its children."""
+    while True:
+        first = arity * root + 1
+        if first >= size:
+            return
+        children = range(low + first, low + min(first + arity, size))
+        largest = low + root
+        for child in children:
+            if sorter.compare(arr[child], arr[largest]):
+                largest = child
+
+        if trace:
+            yield sorter.record_step(
+                arr,
+                "Heapifying subtree rooted at {} (value {})",
+                {'comparing': [low + root, *children]},
+                low + root, arr[low + root]
+            )
+        if largest == low + root:
+            if trace:
+                yield sorter.record_step(
+                    arr,
+                    "Subtree rooted at {} is already a max heap",
+                    {'comparing': [low + root, *children]},
+                    low + root
+                )
+            return
+
+        sorter.swap(arr, low + root, largest)
+        if trace:
+            yield sorter.record_step(
+                arr,
+                "Swapped {} and {} in heap",
+                {'swapping': [low + root, largest], 'comparing': [low + root, *children]},
+                arr[low + root], arr[largest]
+            )
+        root = largest - low
+
+
+def sift_down_bottom_up(sorter, arr, low, root, size, arity=2, trace=False):
+    """Floyd's sift-down: find the leaf on the path of larger children, then climb."""
+    path = [low + root]
+    node = root
+    while True:
+        first = arity * node + 1
+        if first >= size:
+            break
+        largest = low + first
+        for child in range(low + first + 1, low + min(first + arity, size)):
+            if sorter.compare(arr[child], arr[largest]):
+                largest = child
+        path.append(largest)
+        node = largest - low
+
+    if len(path) == 1:
+        return
+    if trace:
+        yield sorter.record_step(
+            arr,
+            "Followed the larger children from {} down to leaf {}",
+            {'comparing': path},
+            path[0], path[-1]
+        )
+
+    # Climb back up to the deepest path node that is not smaller than the value
+    value = arr[path[0]]
+    depth = len(path) - 1
+    while depth > 0 and sorter.compare(value, arr[path[depth]]):
+        depth -= 1
+    if depth == 0:
+        if trace:
+            yield sorter.record_step(
+                arr,
+                "Subtree rooted at {} is already a max heap",
+                {'comparing': path},
+                path[0]
+            )
+        return
+
+    # Shift the path up one level and drop the value into the gap
+    for level in range(depth):
+        arr[path[level]] = arr[path[level + 1]]
+    arr[path[depth]] = value
+    sorter.swaps += depth
+    if trace:
+        yield sorter.record_step(
+            arr,
+            "Moved {} down {} levels to index {}",
+            {'swapping': path[:depth + 1]},
+            value, depth, path[depth]
+        )
+
+
+def build_heap(sorter, arr, low, size, arity=2, bottom_up=False, trace=False):
+    """Heapify arr[low:low + size] from the last parent up (Floyd's O(n) construction)."""
+    sift = sift_down_bottom_up if bottom_up else sift_down
+    for root in range((size - 2) // arity, -1, -1):
+        yield from sift(sorter, arr, low, root, size, arity, trace)
+
+
+def heap_sort_range(sorter, arr, low, high, arity=2, bottom_up=False):
+    """Heap sort arr[low..high] in place, without recording steps."""
+    size = high - low + 1
+    sift = sift_down_bottom_up if bottom_up else sift_down
+    yield from build_heap(sorter, arr, low, size, arity, bottom_up)
+    for end in range(size - 1, 0, -1):
+        sorter.swap(arr, low, low + end)
+        yield from sift(sorter, arr, low, 0, end, arity)
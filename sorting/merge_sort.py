@@ -1,5 +1,4 @@
 # sorting/merge_sort.py
-import time
 from .base_sorter import BaseSorter
 
 class MergeSort(BaseSorter):
@@ -11,12 +10,11 @@ class MergeSort(BaseSorter):
     2. Repeatedly merge adjacent sublists to produce new sorted sublists
     3. Continue until there is only one sublist remaining
     """
-    def sort(self):
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Merge Sort (Bottom-Up)")
+        yield self.record_step(arr, "Start Merge Sort (Bottom-Up)")
 
         # Make a copy to work on
         working_arr = arr.copy()
@@ -31,27 +29,28 @@ class MergeSort(BaseSorter):
 
                 # Only merge if right > mid (i.e., second subarray exists)
                 if mid < right:
-                    self.record_step(
+                    yield self.record_step(
                         working_arr,
-                        f"Merging subarrays [{left}:{mid+1}] and [{mid+1}:{right+1}]",
-                        {'comparing': list(range(left, right + 1))}
+                        "Merging subarrays [{}:{}] and [{}:{}]",
+                        {'comparing': range(left, right + 1)},
+                        left, mid+1, mid+1, right+1
                     )
 
                     # Perform the merge
                     self._merge(working_arr, temp_arr, left, mid, right)
 
-                    self.record_step(
+                    yield self.record_step(
                         working_arr,
-                        f"Merged into sorted subarray [{left}:{right+1}]",
-                        {'sorted': list(range(left, right + 1))}
+                        "Merged into sorted subarray [{}:{}]",
+                        {'sorted': range(left, right + 1)},
+                        left, right+1
                     )
 
                 left += size * 2
 
             size *= 2
 
-        self.end_time = time.time()
-        self.record_step(working_arr, "Merge Sort completed!")
+        yield self.record_step(working_arr, "Merge Sort completed!")
         return working_arr
 
     def _merge(self, arr, temp, left, mid, right):
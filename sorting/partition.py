@@ -0,0 +1,197 @@
+# sorting/partition.py
+import random
+from .base_sorter import BaseSorter
+
+PIVOT_STRATEGIES = ('last', 'median3', 'ninther', 'random')
+PIVOT_NAMES = {
+    'last': "last element",
+    'median3': "median-of-three",
+    'ninther': "ninther",
+    'random': "random element",
+}
+
+
+class PartitionSorter(BaseSorter):
+    """
+    Base class for the partition-based sorters (Quick Sort, IntroSort).
+
+    Options:
+        pivot (str): Pivot strategy: 'last' (Lomuto's classic choice),
+            'median3' (median of first, middle and last, the default),
+            'ninther' (median of three medians of three, for large ranges)
+            or 'random' (seeded, so traces are reproducible).
+        three_way (bool): Dutch national flag partitioning into < pivot,
+            == pivot and > pivot. Elements equal to the pivot are final after
+            one pass, so duplicate-heavy inputs no longer blow up. On by default;
+            False uses the Lomuto scheme.
+        seed: Seed for the 'random' pivot strategy.
+
+    Pivot selection and partitioning keep their own counters, reported by
+    get_metrics() next to the totals.
+    """
+    NINTHER_MIN = 40  # Smaller ranges fall back to median-of-three
+
+    def __init__(self, array, pivot='median3', three_way=True, seed=0, **options):
+        super().__init__(array, **options)
+        if pivot not in PIVOT_STRATEGIES:
+            raise ValueError(f"Unknown pivot strategy: {pivot} (expected one of {', '.join(PIVOT_STRATEGIES)})")
+        self.pivot = pivot
+        self.three_way = three_way
+        self.rng = random.Random(seed)
+        self.pivot_comparisons = 0
+        self.partition_comparisons = 0
+        self.partition_swaps = 0
+
+    def get_metrics(self):
+        metrics = super().get_metrics()
+        metrics['pivot_comparisons'] = self.pivot_comparisons
+        metrics['partition_comparisons'] = self.partition_comparisons
+        metrics['partition_swaps'] = self.partition_swaps
+        return metrics
+
+    def pivot_name(self):
+        return PIVOT_NAMES[self.pivot]
+
+    def _mark_sorted(self, sorted_runs, start, stop):
+        """
+        Add [start, stop) to sorted_runs, a list of disjoint ranges ordered by
+        start, merging it with the runs it touches. Finished regions are only
+        separated by subarrays still on the stack, so the list stays short and
+        can be passed to record_step as a highlight directly.
+        """
+        if start >= stop:
+            return
+        kept = []
+        for run in sorted_runs:
+            if run.stop < start or run.start > stop:
+                kept.append(run)
+            else:
+                start, stop = min(start, run.start), max(stop, run.stop)
+        kept.append(range(start, stop))
+        kept.sort(key=lambda run: run.start)
+        sorted_runs[:] = kept
+
+    def _median_of_three(self, arr, a, b, c):
+        """Index of the median of arr[a], arr[b], arr[c] (2-3 comparisons)."""
+        if self.compare(arr[a], arr[b]):
+            a, b = b, a  # Now arr[a] <= arr[b]
+        if self.compare(arr[b], arr[c]):
+            # arr[c] < arr[b]: the median is the larger of arr[a] and arr[c]
+            return a if self.compare(arr[a], arr[c]) else c
+        return b
+
+    def _choose_pivot(self, arr, low, high):
+        """Return the index of the pivot for arr[low..high], counting its comparisons."""
+        before = self.comparisons
+        if self.pivot == 'last' or high - low < 2:
+            index = high
+        elif self.pivot == 'random':
+            index = self.rng.randint(low, high)
+        elif self.pivot == 'ninther' and high - low + 1 >= self.NINTHER_MIN:
+            step = (high - low + 1) // 8
+            mid = (low + high) // 2
+            index = self._median_of_three(
+                arr,
+                self._median_of_three(arr, low, low + step, low + 2 * step),
+                self._median_of_three(arr, mid - step, mid, mid + step),
+                self._median_of_three(arr, high - 2 * step, high - step, high)
+            )
+        else:
+            index = self._median_of_three(arr, low, (low + high) // 2, high)
+        self.pivot_comparisons += self.comparisons - before
+        return index
+
+    def _partition(self, arr, low, high, trace=False):
+        """
+        Generator partitioning arr[low..high] around the chosen pivot. Returns
+        (lt, gt): arr[lt..gt] holds the pivot value(s), already in final position.
+        With trace=True every comparison and swap is recorded as a step.
+        """
+        pivot_idx = self._choose_pivot(arr, low, high)
+        comparisons, swaps = self.comparisons, self.swaps
+        if self.three_way:
+            lt, gt = yield from self._partition_three_way(arr, low, high, pivot_idx, trace)
+        else:
+            lt = gt = yield from self._partition_lomuto(arr, low, high, pivot_idx, trace)
+        self.partition_comparisons += self.comparisons - comparisons
+        self.partition_swaps += self.swaps - swaps
+        return lt, gt
+
+    def _partition_lomuto(self, arr, low, high, pivot_idx, trace):
+        """Lomuto partition scheme with the pivot moved to the end first"""
+        self.swap(arr, pivot_idx, high)
+        pivot = arr[high]
+        i = low - 1  # Index of smaller element
+
+        for j in range(low, high):
+            if trace:
+                yield self.record_step(
+                    arr,
+                    "Comparing {} with pivot {}",
+                    {'comparing': [j, high]},
+                    arr[j], pivot
+                )
+
+            if not self.compare(arr[j], pivot):  # arr[j] <= pivot
+                i += 1
+                if i != j:
+                    self.swap(arr, i, j)
+                    if trace:
+                        yield self.record_step(
+                            arr,
+                            "Swapped {} and {}",
+                            {'swapping': [i, j]},
+                            arr[i], arr[j]
+                        )
+
+        # Place pivot in correct position
+        if i + 1 != high:
+            self.swap(arr, i + 1, high)
+        return i + 1
+
+    def _partition_three_way(self, arr, low, high, pivot_idx, trace):
+        """
+        Dutch national flag partition: arr[low..lt-1] < pivot, arr[lt..gt] == pivot,
+        arr[gt+1..high] > pivot, with arr[i..gt] still unclassified while scanning.
+        """
+        pivot = arr[pivot_idx]
+        lt, i, gt = low, low, high
+
+        while i <= gt:
+            if trace:
+                yield self.record_step(
+                    arr,
+                    "Comparing {} with pivot {}",
+                    {'comparing': [i], 'sorted': range(lt, i)},
+                    arr[i], pivot
+                )
+
+            if self.compare(pivot, arr[i]):  # arr[i] < pivot
+                if lt != i:
+                    self.swap(arr, lt, i)
+                    if trace:
+                        yield self.record_step(
+                            arr,
+                            "{} < pivot: swapped into the left part",
+                            {'swapping': [lt, i]},
+                            arr[lt]
+                        )
+                lt += 1
+                i += 1
+            elif self.compare(arr[i], pivot):  # arr[i] > pivot
+                # Leave larger elements already at the right end in place; blindly
+                # swapping them in would rotate sorted runs and defeat median-of-three
+                while gt > i and self.compare(arr[gt], pivot):
+                    gt -= 1
+                self.swap(arr, i, gt)
+                if trace:
+                    yield self.record_step(
+                        arr,
+                        "{} > pivot: swapped into the right part",
+                        {'swapping': [i, gt]},
+                        arr[gt]
+                    )
+                gt -= 1
+            else:
+                i += 1
+        return lt, gt
@@ -1,8 +1,8 @@
 # sorting/pigeonhole_sort.py
-import time
-from .base_sorter import BaseSorter
+import numpy as np
+from .sparse import SparseRangeSorter, radix_sorted
 
-class PigeonholeSort(BaseSorter):
+class PigeonholeSort(SparseRangeSorter):
     """
     Pigeonhole Sort Algorithm
     
@@ -11,62 +11,103 @@ class PigeonholeSort(BaseSorter):
     2. Create pigeonholes (buckets) for each value in range
     3. Place each element in its corresponding pigeonhole
     4. Iterate through pigeonholes and put elements back in order
+
+    When the value range is much larger than n, holes exist only for the
+    values present, in a dict (sparse pigeonholes, see SparseRangeSorter
+    for the mode option).
     """
-    def sort(self):
+    supports_vectorized = True
+
+    def __init__(self, array, **options):
+        super().__init__(array, **options)
+        self.hole_mode = None  # 'dense' or 'sparse', set once the sort has run
+
+    def sort_vectorized(self, arr):
+        """Stable argsort on the pigeonhole index, i.e. the same scatter as sort_steps."""
+        if len(arr) <= 1:
+            return arr
+        holes = arr.astype(np.int64)  # int() truncation, as in sort_steps
+        self.hole_mode = 'sparse' if self.use_sparse(int(holes.max()) - int(holes.min()) + 1, len(arr)) else 'dense'
+        return arr[np.argsort(holes, kind='stable')]
+
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Pigeonhole Sort")
+        yield self.record_step(arr, "Start Pigeonhole Sort")
 
         if n <= 1:
-            self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
-            self.end_time = time.time()
+            yield self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
             return arr
 
         min_val = int(min(arr))
         max_val = int(max(arr))
         range_val = max_val - min_val + 1
 
-        self.record_step(
+        yield self.record_step(
             arr,
-            f"Input range: [{min_val}, {max_val}] → Range size = {range_val}, Array size = {n}"
+            "Input range: [{}, {}] → Range size = {}, Array size = {}",
+            None,
+            min_val, max_val, range_val, n
         )
 
-        # Check if pigeonhole sort is appropriate
-        if range_val > n * 10:  # Heuristic: if range is much larger than n, warn
-            self.record_step(
+        # Create pigeonholes: one per value in range, or only for the values present
+        if self.use_sparse(range_val, n):
+            self.hole_mode = 'sparse'
+            holes = {}
+            yield self.record_step(
                 arr,
-                f"⚠️ Pigeonhole Sort is inefficient when range ({range_val}) >> n ({n})."
+                "Range ({}) >> n ({}): using sparse pigeonholes for the values present only",
+                None,
+                range_val, n
             )
+        else:
+            self.hole_mode = 'dense'
+            if range_val > n * 10:  # Heuristic: if range is much larger than n, warn
+                yield self.record_step(
+                    arr,
+                    "⚠️ Pigeonhole Sort is inefficient when range ({}) >> n ({}).",
+                    None,
+                    range_val, n
+                )
+            holes = [[] for _ in range(range_val)]
+            yield self.record_step(arr, "Created {} pigeonholes", None, range_val)
 
-        # Create pigeonholes
-        pigeonholes = [[] for _ in range(range_val)]
-        self.record_step(arr, f"Created {range_val} pigeonholes")
-
-        # Place elements in pigeonholes
+        # Place elements in pigeonholes (the array itself does not change)
         for i, value in enumerate(arr):
             idx = int(value) - min_val
-            pigeonholes[idx].append(value)
-            self.record_step(
+            if self.hole_mode == 'sparse':
+                holes.setdefault(idx, []).append(value)
+            else:
+                holes[idx].append(value)
+            yield self.record_step(
                 arr,
-                f"Placed {value} in pigeonhole {idx}",
-                {'comparing': [i]}
+                "Placed {} in pigeonhole {}",
+                {'comparing': [i]},
+                value, idx,
+                changed=()
             )
 
-        # Reconstruct sorted array
-        sorted_arr = []
-        for i, hole in enumerate(pigeonholes):
-            if hole:
-                actual_value = min_val + i
-                self.record_step(
-                    sorted_arr + hole + [x for h in pigeonholes[i+1:] for x in h],
-                    f"Emptying pigeonhole {i} (value {actual_value}): {hole}",
-                    {'sorted': list(range(len(sorted_arr), len(sorted_arr) + len(hole)))}
-                )
-                sorted_arr.extend(hole)
-            # else: empty pigeonhole — skip
+        if self.hole_mode == 'sparse':
+            order = radix_sorted(list(holes))
+            yield self.record_step(arr, "Ordered the {} non-empty pigeonholes", None, len(order), changed=())
+            filled = [(idx, holes[idx]) for idx in order]
+        else:
+            filled = [(idx, hole) for idx, hole in enumerate(holes) if hole]
+
+        # The displayed array while emptying is every hole's contents in hole
+        # order, whichever hole is being emptied; build it once, O(n + k)
+        sorted_arr = np.array([x for _, hole in filled for x in hole], dtype=arr.dtype)
+        start = 0
+        for idx, hole in filled:
+            yield self.record_step(
+                sorted_arr,
+                "Emptying pigeonhole {} (value {}): {}",
+                {'sorted': range(start, start + len(hole))},
+                idx, min_val + idx, hole,
+                changed=None if start == 0 else ()
+            )
+            start += len(hole)
 
-        self.end_time = time.time()
-        self.record_step(sorted_arr, "Pigeonhole Sort completed!")
-        return sorted_arr
\ No newline at end of file
+        yield self.record_step(sorted_arr, "Pigeonhole Sort completed!", changed=())
+        return sorted_arr
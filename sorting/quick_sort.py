@@ -1,88 +1,72 @@
 # sorting/quick_sort.py
-import time
-from .base_sorter import BaseSorter
+from .partition import PartitionSorter
 
-class QuickSort(BaseSorter):
+class QuickSort(PartitionSorter):
     """
     Quick Sort Algorithm (Iterative Implementation with Stack)
-    
+
     Steps:
-    1. Choose a 'pivot' element from the array
-    2. Partition the array so elements < pivot are on left, > on right
+    1. Choose a 'pivot' element (median-of-three by default, see PartitionSorter)
+    2. Partition the array into < pivot, == pivot and > pivot
     3. Recursively sort the sub-arrays (simulated with a stack)
     """
-    def sort(self):
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Quick Sort (Iterative)")
+        yield self.record_step(
+            arr,
+            "Start Quick Sort (Iterative, {} pivot, {} partitioning)",
+            None,
+            self.pivot_name(), "three-way" if self.three_way else "Lomuto"
+        )
 
         # Stack stores (low, high) indices of subarrays to sort
         stack = [(0, n - 1)]
-        sorted_ranges = []  # Track fully sorted ranges for highlighting
+        sorted_ranges = []  # Merged runs of fully sorted positions, for highlighting
 
         while stack:
             low, high = stack.pop()
+            if low == high:
+                self._mark_sorted(sorted_ranges, low, low + 1)  # A single element is in place
             if low < high:
                 # Highlight current partition range
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"Partitioning subarray [{low}:{high+1}]",
-                    {'comparing': list(range(low, high + 1))}
+                    "Partitioning subarray [{}:{}]",
+                    {'comparing': range(low, high + 1)},
+                    low, high+1
                 )
 
-                # Partition and get pivot index
-                pivot_idx = self._partition(arr, low, high)
+                # Partition and get the range holding the pivot value
+                lt, gt = yield from self._partition(arr, low, high, trace=True)
 
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"Pivot {arr[pivot_idx]} placed at index {pivot_idx}",
-                    {'swapping': [pivot_idx], 'comparing': list(range(low, high + 1))}
+                    "Pivot {} placed at [{}:{}] ({} pivot comparisons, "
+                    "{} partition comparisons, {} partition swaps so far)",
+                    {'swapping': range(lt, gt + 1), 'comparing': range(low, high + 1)},
+                    arr[lt], lt, gt + 1,
+                    self.pivot_comparisons, self.partition_comparisons, self.partition_swaps
                 )
 
-                # After partition, pivot is in final position
-                sorted_ranges.append(pivot_idx)
+                # After partition, the pivot values are in final position
+                self._mark_sorted(sorted_ranges, lt, gt + 1)
 
-                # Push right subarray, then left (stack is LIFO)
-                stack.append((pivot_idx + 1, high))
-                stack.append((low, pivot_idx - 1))
+                # Push the larger side first so the stack stays O(log n) deep
+                left, right = (low, lt - 1), (gt + 1, high)
+                if lt - low > high - gt:
+                    stack.extend((left, right))
+                else:
+                    stack.extend((right, left))
 
                 # Highlight sorted pivot
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"Subarray [{low}:{high+1}] partitioned. Pivot {arr[pivot_idx]} is sorted.",
-                    {'sorted': sorted_ranges.copy()}
+                    "Subarray [{}:{}] partitioned. Pivot {} is sorted.",
+                    {'sorted': sorted_ranges},
+                    low, high+1, arr[lt]
                 )
 
-        self.end_time = time.time()
-        self.record_step(arr, "Quick Sort completed!")
+        yield self.record_step(arr, "Quick Sort completed!")
         return arr
-
-    def _partition(self, arr, low, high):
-        """Lomuto partition scheme: pivot is last element"""
-        pivot = arr[high]
-        i = low - 1  # Index of smaller element
-
-        for j in range(low, high):
-            # Highlight current comparison
-            self.record_step(
-                arr,
-                f"Comparing {arr[j]} with pivot {pivot}",
-                {'comparing': [j, high]}
-            )
-            
-            if not self.compare(arr[j], pivot):  # arr[j] <= pivot
-                i += 1
-                if i != j:
-                    self.swap(arr, i, j)
-                    self.record_step(
-                        arr,
-                        f"Swapped {arr[i]} and {arr[j]}",
-                        {'swapping': [i, j]}
-                    )
-
-        # Place pivot in correct position
-        if i + 1 != high:
-            self.swap(arr, i + 1, high)
-        return i + 1
\ No newline at end of file
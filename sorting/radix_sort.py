@@ -1,117 +1,272 @@
 # sorting/radix_sort.py
-import time
+import numpy as np
 from .base_sorter import BaseSorter
-from .counting_sort import CountingSort
+
+
+def _float_keys(arr):
+    """Map float64 values to uint64 keys in the same order (IEEE-754 bit trick)."""
+    bits = np.asarray(arr, dtype=np.float64).view(np.uint64)
+    sign = bits >> np.uint64(63)
+    # Negative numbers: flip every bit; non-negative numbers: set the sign bit
+    return np.where(sign == 1, ~bits, bits | np.uint64(1 << 63))
+
+
+def _is_integral(arr):
+    """True if arr holds integers, or floats that are all whole numbers that fit in int64."""
+    arr = np.asarray(arr)
+    if arr.dtype.kind in 'iub':
+        return True
+    return bool(np.all(np.isfinite(arr)) and np.all(arr == np.floor(arr))
+                and np.all(np.abs(arr) < 2 ** 63))
+
 
 class RadixSort(BaseSorter):
     """
-    Radix Sort Algorithm (Least Significant Digit - LSD)
-    
-    Steps:
-    1. Find the maximum number to know number of digits
-    2. Do counting sort for every digit (from least to most significant)
+    Radix Sort Algorithm (Least Significant Digit - LSD, or Most Significant Digit - MSD)
+
+    Steps (LSD):
+    1. Find the maximum key to know the number of digits
+    2. Do a stable counting sort for every digit (from least to most significant)
+
+    Steps (MSD):
+    1. Counting sort by the most significant digit
+    2. Recurse into every bucket with the next digit
+
+    Options:
+        base (int): Radix, 10 by default. Powers of two (256, 65536) extract
+            digits with shifts and masks and need far fewer passes on wide keys.
+        msd (bool): Use the MSD variant instead of LSD.
+
+    Negative integers are sorted by absolute value and reversed. Non-integral
+    floats are sorted by order-preserving 64-bit keys of their bit patterns.
     """
-    def sort(self):
+    supports_vectorized = True
+
+    def __init__(self, array, base=10, msd=False, **options):
+        super().__init__(array, **options)
+        if base < 2:
+            raise ValueError("Radix Sort needs a base of at least 2")
+        self.base = base
+        self.msd = msd
+        # Power-of-two bases use shifts and masks instead of division
+        self.digit_bits = base.bit_length() - 1 if base & (base - 1) == 0 else None
+
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
+        variant = "MSD" if self.msd else "LSD"
 
-        self.record_step(arr, "Start Radix Sort (LSD)")
+        yield self.record_step(arr, "Start Radix Sort ({}, base {})", None, variant, self.base)
 
         if n == 0:
-            self.record_step(arr, "Empty array. Sorting complete!")
-            self.end_time = time.time()
+            yield self.record_step(arr, "Empty array. Sorting complete!")
             return arr
 
+        if not _is_integral(arr):
+            yield self.record_step(
+                arr,
+                "Non-integer input: sorting order-preserving 64-bit keys of the IEEE-754 bit patterns"
+            )
+            sorted_arr = yield from self._radix_sort_keys(_float_keys(arr).tolist(), list(arr))
+            yield self.record_step(sorted_arr, "Radix Sort completed!")
+            return sorted_arr
+
         # Handle negative numbers by separating and recombining
         negative = [x for x in arr if x < 0]
         positive = [x for x in arr if x >= 0]
 
         sorted_arr = []
 
-        # Sort negative numbers (make positive, sort, then reverse and negate)
+        # Sort negative numbers by absolute value, then reverse
         if negative:
-            neg_abs = [-x for x in negative]
-            self.record_step(
+            yield self.record_step(
                 arr,
-                f"Separating {len(negative)} negative numbers for special handling"
+                "Separating {} negative numbers for special handling",
+                None,
+                len(negative)
             )
-            neg_sorted_abs = self._radix_sort_positive(neg_abs)
-            neg_sorted = [-x for x in reversed(neg_sorted_abs)]  # Reverse for correct order
-            sorted_arr.extend(neg_sorted)
+            neg_sorted = yield from self._radix_sort_keys([-int(x) for x in negative], negative)
+            sorted_arr.extend(reversed(neg_sorted))  # Reverse for correct order
 
         # Sort positive numbers
         if positive:
-            pos_sorted = self._radix_sort_positive(positive)
+            pos_sorted = yield from self._radix_sort_keys([int(x) for x in positive], positive)
             sorted_arr.extend(pos_sorted)
 
-        self.end_time = time.time()
-        self.record_step(sorted_arr, "Radix Sort completed!")
+        yield self.record_step(sorted_arr, "Radix Sort completed!")
         return sorted_arr
 
-    def _radix_sort_positive(self, arr):
-        """Helper to sort non-negative integers using Radix Sort"""
-        if not arr:
-            return arr
+    def _num_passes(self, max_key):
+        """Number of digits of max_key in the configured base."""
+        if self.digit_bits:
+            return -(-max_key.bit_length() // self.digit_bits)
+        passes = 0
+        while max_key > 0:
+            max_key //= self.base
+            passes += 1
+        return passes
 
-        max_val = max(arr)
-        digit_place = 1
+    def _digits(self, keys, digit):
+        """Extract digit number `digit` (0 = least significant) of every key."""
+        if self.digit_bits:
+            shift, mask = digit * self.digit_bits, self.base - 1
+            return [(k >> shift) & mask for k in keys]
+        place = self.base ** digit
+        return [(k // place) % self.base for k in keys]
 
-        current_arr = arr.copy()
+    def _radix_sort_keys(self, keys, values):
+        """Sort values by their non-negative integer keys. Returns the sorted values."""
+        if not keys:
+            return values
 
-        while max_val // digit_place > 0:
-            self.record_step(
-                current_arr,
-                f"Sorting by digit at place {digit_place} (units=1, tens=10, etc.)"
-            )
+        passes = self._num_passes(max(keys))
+        if self.msd:
+            keys, values = list(keys), list(values)
+            yield from self._msd_sort(keys, values, 0, len(keys), passes - 1)
+            return values
 
-            # Extract the current digit for each number
-            digit_arr = [self._get_digit(x, digit_place) for x in current_arr]
-            
-            # Create a combined array for stable sorting: (digit, original_value)
-            # But we'll use Counting Sort on digits while keeping original values
-            current_arr = self._counting_sort_by_digit(current_arr, digit_place)
-            
-            self.record_step(
-                current_arr,
-                f"After sorting by digit {digit_place}: {current_arr}"
+        for digit in range(passes):
+            yield self.record_step(
+                values,
+                "Sorting by digit {} (place value {}^{})",
+                None,
+                digit, self.base, digit
+            )
+            keys, values, _ = self._counting_sort_by_digit(keys, values, digit)
+            yield self.record_step(
+                values,
+                "After sorting by digit {}: {}",
+                None,
+                digit, values
             )
 
-            digit_place *= 10
+        return values
 
-        return current_arr
+    def _msd_sort(self, keys, values, lo, hi, digit):
+        """Sort keys/values[lo:hi] in place by digit, then recurse into each bucket."""
+        if hi - lo < 2 or digit < 0:
+            return
+        yield self.record_step(
+            values,
+            "MSD: sorting positions {}..{} by digit {}",
+            {'comparing': range(lo, hi)},
+            lo, hi - 1, digit
+        )
+        keys[lo:hi], values[lo:hi], digits = self._counting_sort_by_digit(keys[lo:hi], values[lo:hi], digit)
 
-    def _get_digit(self, number, place):
-        """Get the digit at the given place (1=units, 10=tens, etc.)"""
-        return (number // place) % 10
+        # Buckets are the runs of equal digits in the sorted slice
+        start = 0
+        for i in range(1, len(digits) + 1):
+            if i == len(digits) or digits[i] != digits[start]:
+                if i - start > 1:
+                    yield from self._msd_sort(keys, values, lo + start, lo + i, digit - 1)
+                start = i
 
-    def _counting_sort_by_digit(self, arr, place):
-        """Counting sort based on a specific digit place"""
-        n = len(arr)
-        if n == 0:
-            return arr
-
-        # Extract digits
-        digits = [self._get_digit(x, place) for x in arr]
-        max_digit = 9  # Digits are 0-9
+    def _counting_sort_by_digit(self, keys, values, digit):
+        """
+        Stable counting sort of keys/values on one digit, extracting each digit
+        once. Returns the reordered keys, values and their digits.
+        """
+        n = len(keys)
+        digits = self._digits(keys, digit)
 
-        # Count frequencies (digits 0-9)
-        count = [0] * 10
+        # Count frequencies (only over the digits present when the base exceeds n)
+        if self.base > n:
+            present = sorted(set(digits))
+            count = dict.fromkeys(present, 0)
+        else:
+            present = range(self.base)
+            count = [0] * self.base
         for d in digits:
             count[d] += 1
             self.comparisons += 1  # Count as comparison
 
         # Cumulative count
-        for i in range(1, 10):
-            count[i] += count[i - 1]
+        total = 0
+        for d in present:
+            total += count[d]
+            count[d] = total
 
         # Build output array (stable: iterate from back)
-        output = [0] * n
+        out_keys = [0] * n
+        out_values = [0] * n
+        out_digits = [0] * n
         for i in range(n - 1, -1, -1):
             d = digits[i]
             pos = count[d] - 1
-            output[pos] = arr[i]
+            out_keys[pos] = keys[i]
+            out_values[pos] = values[i]
+            out_digits[pos] = d
             count[d] -= 1
             self.swaps += 1
 
-        return output
\ No newline at end of file
+        return out_keys, out_values, out_digits
+
+    def sort_vectorized(self, arr):
+        """LSD passes as stable argsorts on digits extracted with array arithmetic."""
+        if len(arr) == 0:
+            return arr
+        if not _is_integral(arr):
+            keys = _float_keys(arr)
+            order = self._radix_order_vectorized(keys)
+            return arr[order]
+
+        keys = arr.astype(np.int64)
+        negative = keys < 0
+        parts = []
+        if negative.any():
+            order = self._radix_order_vectorized(-keys[negative])
+            parts.append(arr[negative][order][::-1])
+        if not negative.all():
+            order = self._radix_order_vectorized(keys[~negative])
+            parts.append(arr[~negative][order])
+        return np.concatenate(parts)
+
+    def _radix_order_vectorized(self, keys):
+        """
+        Return the permutation that sorts the non-negative keys, updating the
+        counters exactly like _radix_sort_keys does.
+        """
+        n = len(keys)
+        passes = self._num_passes(int(keys.max()))
+
+        if self.msd:
+            order = np.argsort(keys, kind='stable')
+            ordered = keys[order]
+            # An element takes part in the pass on a digit when the keys sharing
+            # its higher digits form a bucket of two or more
+            for digit in range(passes - 1, -1, -1):
+                prefix = self._prefix_vectorized(ordered, digit + 1)
+                run_starts = np.flatnonzero(np.concatenate(([True], prefix[1:] != prefix[:-1])))
+                sizes = np.diff(np.append(run_starts, n))
+                processed = int(sizes[sizes > 1].sum())
+                self.comparisons += processed
+                self.swaps += processed
+            return order
+
+        order = np.arange(n)
+        for digit in range(passes):
+            digits = self._digit_vectorized(keys[order], digit)
+            # Small digits let NumPy's stable sort use its own radix kernel
+            if self.base <= 256:
+                digits = digits.astype(np.uint8)
+            elif self.base <= 65536:
+                digits = digits.astype(np.uint16)
+            order = order[np.argsort(digits, kind='stable')]
+            # _counting_sort_by_digit counts one comparison and one swap per element
+            self.comparisons += n
+            self.swaps += n
+        return order
+
+    def _digit_vectorized(self, keys, digit):
+        if self.digit_bits:
+            return (keys >> (digit * self.digit_bits)) & (self.base - 1)
+        return (keys // self.base ** digit) % self.base
+
+    def _prefix_vectorized(self, keys, digits):
+        """Keys with their lowest `digits` digits removed."""
+        if self.base ** digits >= 2 ** 64:
+            return np.zeros_like(keys)
+        if self.digit_bits:
+            return keys >> (digits * self.digit_bits)
+        return keys // self.base ** digits
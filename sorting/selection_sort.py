@@ -1,5 +1,4 @@
 # sorting/selection_sort.py
-import time
 from .base_sorter import BaseSorter
 
 class SelectionSort(BaseSorter):
@@ -11,54 +10,57 @@ class SelectionSort(BaseSorter):
     2. Swap it with the first unsorted element
     3. Move the boundary of sorted/unsorted one position right
     """
-    def sort(self):
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Selection Sort")
+        yield self.record_step(arr, "Start Selection Sort")
 
         for i in range(n):
             # Assume the first unsorted element is the minimum
             min_idx = i
             
             # Highlight the current position being filled
-            self.record_step(
+            yield self.record_step(
                 arr,
-                f"Finding minimum in unsorted subarray [{i}:{n}]",
-                {'comparing': [i], 'sorted': list(range(i))}
+                "Finding minimum in unsorted subarray [{}:{}]",
+                {'comparing': [i], 'sorted': range(i)},
+                i, n
             )
 
             # Search for the actual minimum in the unsorted part
             for j in range(i + 1, n):
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"Comparing {arr[j]} with current min {arr[min_idx]}",
-                    {'comparing': [min_idx, j], 'sorted': list(range(i))}
+                    "Comparing {} with current min {}",
+                    {'comparing': [min_idx, j], 'sorted': range(i)},
+                    arr[j], arr[min_idx]
                 )
                 if self.compare(arr[min_idx], arr[j]):
                     min_idx = j
-                    self.record_step(
+                    yield self.record_step(
                         arr,
-                        f"New minimum found: {arr[min_idx]}",
-                        {'comparing': [min_idx], 'sorted': list(range(i))}
+                        "New minimum found: {}",
+                        {'comparing': [min_idx], 'sorted': range(i)},
+                        arr[min_idx]
                     )
 
             # Swap the found minimum with the first unsorted element
             if min_idx != i:
                 self.swap(arr, i, min_idx)
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"Swapped {arr[i]} and {arr[min_idx]}. Position {i} is now sorted.",
-                    {'swapping': [i, min_idx], 'sorted': list(range(i + 1))}
+                    "Swapped {} and {}. Position {} is now sorted.",
+                    {'swapping': [i, min_idx], 'sorted': range(i + 1)},
+                    arr[i], arr[min_idx], i
                 )
             else:
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"{arr[i]} is already in correct position.",
-                    {'sorted': list(range(i + 1))}
+                    "{} is already in correct position.",
+                    {'sorted': range(i + 1)},
+                    arr[i]
                 )
 
-        self.end_time = time.time()
-        self.record_step(arr, "Selection Sort completed!")
+        yield self.record_step(arr, "Selection Sort completed!")
         return arr
\ No newline at end of file
@@ -1,5 +1,4 @@
 # sorting/shell_sort.py
-import time
 from .base_sorter import BaseSorter
 
 class ShellSort(BaseSorter):
@@ -12,16 +11,14 @@ class ShellSort(BaseSorter):
     3. Reduce gap and repeat until gap = 1
     4. Final pass is standard Insertion Sort
     """
-    def sort(self):
+    def sort_steps(self):
         arr = self.original_array.copy()
         n = len(arr)
-        self.start_time = time.time()
 
-        self.record_step(arr, "Start Shell Sort (Knuth's sequence)")
+        yield self.record_step(arr, "Start Shell Sort (Knuth's sequence)")
 
         if n <= 1:
-            self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
-            self.end_time = time.time()
+            yield self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
             return arr
 
         # Generate Knuth's sequence: h = 3*h + 1
@@ -33,10 +30,11 @@ class ShellSort(BaseSorter):
 
         while gap >= 1:
             pass_num += 1
-            self.record_step(
+            yield self.record_step(
                 arr,
-                f"Pass {pass_num}: Gap = {gap}",
-                {'comparing': list(range(n))}
+                "Pass {}: Gap = {}",
+                {'comparing': range(n)},
+                pass_num, gap
             )
 
             # Gapped insertion sort
@@ -44,20 +42,22 @@ class ShellSort(BaseSorter):
                 key = arr[i]
                 j = i
                 # Highlight current element being inserted
-                self.record_step(
+                yield self.record_step(
                     arr,
-                    f"Inserting {key} with gap {gap}",
-                    {'comparing': [i]}
+                    "Inserting {} with gap {}",
+                    {'comparing': [i]},
+                    key, gap
                 )
 
                 while j >= gap and self.compare(arr[j - gap], key):
                     arr[j] = arr[j - gap]
                     j -= gap
                     self.swaps += 1
-                    self.record_step(
+                    yield self.record_step(
                         arr,
-                        f"Shifted {arr[j]} right by gap {gap}",
-                        {'swapping': [j, j + gap]}
+                        "Shifted {} right by gap {}",
+                        {'swapping': [j, j + gap]},
+                        arr[j], gap
                     )
 
                 arr[j] = key
@@ -65,6 +65,5 @@ class ShellSort(BaseSorter):
 
             gap //= 3
 
-        self.end_time = time.time()
-        self.record_step(arr, "Shell Sort completed!")
+        yield self.record_step(arr, "Shell Sort completed!")
         return arr
\ No newline at end of file
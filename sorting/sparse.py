@@ -0,0 +1,46 @@
+# sorting/sparse.py
+from .base_sorter import BaseSorter
+
+
+def radix_sorted(keys):
+    """Sort distinct non-negative ints with byte-wise LSD passes (no comparisons)."""
+    shift = 0
+    top = max(keys)
+    while top >> shift:
+        buckets = [[] for _ in range(256)]
+        for k in keys:
+            buckets[(k >> shift) & 255].append(k)
+        keys = [k for bucket in buckets for k in bucket]
+        shift += 8
+    return keys
+
+
+class SparseRangeSorter(BaseSorter):
+    """
+    Base class for the sorters that index an array by value (Counting Sort,
+    Pigeonhole Sort).
+
+    When the value range k is much larger than n (say, one outlier of 10^9
+    in a small CSV file) an array of size k would not fit in memory, so
+    these sorters switch to a sparse mode that keeps a dict of the values
+    present and orders them with radix_sorted, which keeps the sort
+    comparison-free and memory O(n).
+
+    Options:
+        mode (str): 'auto' (default), 'dense' or 'sparse'.
+    """
+    MODES = ('auto', 'dense', 'sparse')
+    SPARSE_RATIO = 8  # auto mode goes sparse when k > SPARSE_RATIO * n (and k is not tiny)
+    SPARSE_MIN_RANGE = 1024
+
+    def __init__(self, array, mode='auto', **options):
+        super().__init__(array, **options)
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode: {mode} (expected one of {', '.join(self.MODES)})")
+        self.mode = mode
+
+    def use_sparse(self, k, n):
+        """Whether a value range of size k over n elements should use the sparse mode."""
+        if self.mode != 'auto':
+            return self.mode == 'sparse'
+        return k > self.SPARSE_MIN_RANGE and k > self.SPARSE_RATIO * n
@@ -0,0 +1,299 @@
+# sorting/step_log.py
+from array import array as _array
+from bisect import bisect_right
+import numpy as np
+
+class Step:
+    """
+    A single recorded step. Uses __slots__ to stay small and supports
+    dict-style access (step['array'], step.get('highlights', {})) so code
+    written against the old step dicts keeps working.
+
+    The explanation is kept as a str.format template plus arguments and is
+    only formatted when it is actually read. comparisons, swaps and timestamp
+    are the sorter's cumulative counters and in-algorithm time (seconds) at
+    the moment the step was recorded.
+    """
+    __slots__ = ('array', 'highlights', '_template', '_args', 'comparisons', 'swaps', 'timestamp')
+
+    def __init__(self, array, explanation="", highlights=None, args=(),
+                 comparisons=0, swaps=0, timestamp=0.0):
+        self.array = array
+        self.highlights = highlights or {}
+        self._template = explanation
+        self._args = args
+        self.comparisons = comparisons
+        self.swaps = swaps
+        self.timestamp = timestamp
+
+    @property
+    def explanation(self):
+        if self._args:
+            return self._template.format(*self._args)
+        return self._template
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+class GrowableArray:
+    """Preallocated NumPy buffer that doubles its capacity when full."""
+    __slots__ = ('data', 'size')
+
+    def __init__(self, dtype, capacity=64):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _reserve(self, size):
+        if size > len(self.data):
+            grown = np.empty(max(size, 2 * len(self.data)), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+
+    def append(self, value):
+        self._reserve(self.size + 1)
+        self.data[self.size] = value
+        self.size += 1
+
+    def extend(self, values):
+        end = self.size + len(values)
+        self._reserve(end)
+        self.data[self.size:end] = values
+        self.size = end
+
+    def view(self):
+        return self.data[:self.size]
+
+
+class StepLog:
+    """
+    Delta-encoded, array-backed log of recorded sorting steps.
+
+    Instead of copying the whole array on every step, only the positions whose
+    values changed since the previous step are stored. A full keyframe copy is
+    taken on the first step, whenever the array length or dtype changes, and
+    once the deltas since the last keyframe add up to the array length (or
+    max(max_keyframe_gap, n) steps have passed, which only matters for long
+    runs of tiny deltas). Any step can therefore be rebuilt from the nearest
+    keyframe by replaying at most about n deltas.
+
+    Deltas and highlights are packed into flat array.array / NumPy buffers
+    indexed by per-step offsets, so a step costs a few bytes plus what
+    actually changed. Highlights are stored as (kind, start, stop) index
+    ranges, which keeps long runs such as {'sorted': list(range(i))} to a
+    single entry; a list of range objects is stored as one entry per range. Explanations are stored as an interned template id plus
+    their arguments and formatted only when a step is displayed. Cumulative
+    comparison/swap counters and timestamps are kept in parallel arrays, so
+    the exact metrics at any step are an O(1) lookup (see metrics_at).
+    """
+    def __init__(self, max_keyframe_gap=1024):
+        self.max_keyframe_gap = max_keyframe_gap
+
+        # Keyframes: step index and full array copy of every segment start
+        self._keyframe_steps = _array('q')
+        self._keyframes = []
+        # Deltas of step s live in _delta_indices[_delta_offsets[s]:_delta_offsets[s + 1]];
+        # values are kept per keyframe segment since the dtype may change between segments
+        self._delta_offsets = _array('q', [0])
+        self._delta_indices = _array('i')
+        self._segment_values = []
+        self._segment_offsets = []  # _delta_indices offset where each segment starts
+
+        # Highlights of step s live in entries _highlight_offsets[s]:_highlight_offsets[s + 1]
+        self._highlight_kinds = []  # Kind names, indexed by the stored kind code
+        self._highlight_offsets = _array('q', [0])
+        self._highlight_codes = _array('B')
+        self._highlight_starts = _array('i')
+        self._highlight_stops = _array('i')
+
+        # Explanation of step s is _templates[_template_ids[s]] formatted with
+        # _arguments[_argument_offsets[s]:_argument_offsets[s + 1]]
+        self._templates = []
+        self._template_index = {}
+        self._template_ids = _array('i')
+        self._arguments = []
+        self._argument_offsets = _array('q', [0])
+
+        # Cumulative metrics of step s, one entry per step
+        self._comparisons = _array('q')
+        self._swaps = _array('q')
+        self._timestamps = _array('d')
+
+        self._last = None          # Array as of the most recent step
+        self._delta_size = 0       # Changed positions since the last keyframe
+        self._cursor_index = -1    # Last rebuilt step, for cheap sequential access
+        self._cursor_array = None
+
+    def __len__(self):
+        return len(self._template_ids)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("step index out of range")
+        args = self._arguments[self._argument_offsets[index]:self._argument_offsets[index + 1]]
+        return Step(
+            self._rebuild(index).copy(),
+            self._templates[self._template_ids[index]],
+            self._rebuild_highlights(index),
+            tuple(args),
+            *self.metrics_at(index)
+        )
+
+    def metrics_at(self, index):
+        """Return (comparisons, swaps, timestamp) as of step index, without rebuilding the step."""
+        return self._comparisons[index], self._swaps[index], self._timestamps[index]
+
+    def append(self, array, explanation="", highlights=None, args=(),
+               comparisons=0, swaps=0, timestamp=0.0, changed=None):
+        """
+        Record a new step, storing only what changed since the previous one.
+        explanation is a str.format template for args; formatting is deferred
+        until the step is read, so args must not be mutated afterwards.
+        comparisons, swaps and timestamp are the cumulative metrics so far.
+        changed optionally lists (or ranges over) the only positions that may
+        differ from the previous step, which replaces the O(n) diff with one
+        over those positions; pass a NumPy array for array so that step is
+        O(len(changed)) as a whole.
+        """
+        array = np.asarray(array)
+        index = len(self)
+        last = self._last
+
+        if (last is None
+                or last.shape != array.shape
+                or last.dtype != array.dtype
+                or self._delta_size >= max(1, len(array))
+                or index - self._keyframe_steps[-1] >= max(self.max_keyframe_gap, len(array))):
+            self._keyframe_steps.append(index)
+            self._keyframes.append(array.copy())
+            self._segment_values.append(GrowableArray(array.dtype))
+            self._segment_offsets.append(len(self._delta_indices))
+            self._last = array.copy()
+            self._delta_size = 0
+        else:
+            if changed is None:
+                changed = (array != last).nonzero()[0]
+            else:
+                if isinstance(changed, range):
+                    changed = np.arange(changed.start, changed.stop, changed.step)
+                changed = np.asarray(changed, dtype=np.intp)
+                changed = changed[array[changed] != last[changed]]
+            if len(changed):
+                values = array[changed]
+                if len(changed) > 16:
+                    self._delta_indices.frombytes(changed.astype(np.int32).tobytes())
+                else:
+                    self._delta_indices.extend(changed.tolist())
+                self._segment_values[-1].extend(values)
+                last[changed] = values
+                self._delta_size += len(changed)
+        self._delta_offsets.append(len(self._delta_indices))
+
+        for kind, indices in (highlights or {}).items():
+            self._append_highlight(kind, indices)
+        self._highlight_offsets.append(len(self._highlight_codes))
+
+        template_id = self._template_index.get(explanation)
+        if template_id is None:
+            template_id = self._template_index[explanation] = len(self._templates)
+            self._templates.append(explanation)
+        self._template_ids.append(template_id)
+        self._arguments.extend(args)
+        self._argument_offsets.append(len(self._arguments))
+
+        self._comparisons.append(comparisons)
+        self._swaps.append(swaps)
+        self._timestamps.append(timestamp)
+
+    def _append_highlight(self, kind, indices):
+        """Store one highlight list (or range) as runs of consecutive indices."""
+        if kind not in self._highlight_kinds:
+            self._highlight_kinds.append(kind)
+        code = self._highlight_kinds.index(kind)
+
+        if isinstance(indices, range) and indices.step == 1:
+            # Contiguous run passed as a range: O(1) regardless of its length
+            starts, stops = [indices.start], [indices.start + len(indices)]
+        elif isinstance(indices, list) and indices and isinstance(indices[0], range):
+            # List of runs, e.g. the merged sorted regions of a partition sort
+            starts = [run.start for run in indices]
+            stops = [max(run.start, run.stop) for run in indices]
+        elif len(indices) > 16:
+            first = int(indices[0])
+            if list(indices) == list(range(first, first + len(indices))):
+                # Common case: one contiguous run such as list(range(i))
+                starts, stops = [first], [first + len(indices)]
+            else:
+                # Long scattered lists: find the runs with NumPy and copy them in as raw bytes
+                idx = np.asarray(indices, dtype=np.int32)
+                breaks = (np.diff(idx) != 1).nonzero()[0] + 1
+                starts = idx[np.concatenate(([0], breaks))]
+                stops = idx[np.concatenate((breaks - 1, [len(idx) - 1]))] + 1
+                self._highlight_codes.frombytes(bytes([code]) * len(starts))
+                self._highlight_starts.frombytes(starts.tobytes())
+                self._highlight_stops.frombytes(stops.tobytes())
+                return
+        else:
+            starts, stops = [], []
+            for i in indices:
+                i = int(i)
+                if stops and stops[-1] == i:
+                    stops[-1] = i + 1
+                else:
+                    starts.append(i)
+                    stops.append(i + 1)
+            if not starts:
+                # Keep the key even when the list is empty
+                starts, stops = [0], [0]
+
+        self._highlight_codes.extend([code] * len(starts))
+        self._highlight_starts.extend(starts)
+        self._highlight_stops.extend(stops)
+
+    def _rebuild_highlights(self, index):
+        offsets = self._highlight_offsets
+        highlights = {}
+        for e in range(offsets[index], offsets[index + 1]):
+            kind = self._highlight_kinds[self._highlight_codes[e]]
+            start, stop = self._highlight_starts[e], self._highlight_stops[e]
+            highlights.setdefault(kind, []).extend(range(start, stop))
+        return highlights
+
+    def _rebuild(self, index):
+        """Return the array at step index, replaying deltas from the nearest keyframe."""
+        k = bisect_right(self._keyframe_steps, index) - 1
+        start = self._keyframe_steps[k]
+
+        # Continue from the cached cursor when it sits between the keyframe and index
+        if start <= self._cursor_index <= index:
+            start, array = self._cursor_index, self._cursor_array
+        else:
+            array = self._keyframes[k].copy()
+
+        lo = self._delta_offsets[start + 1]
+        hi = self._delta_offsets[index + 1]
+        if hi > lo:
+            base = self._segment_offsets[k]
+            indices = np.frombuffer(self._delta_indices, dtype=np.int32)[lo:hi][::-1]
+            values = self._segment_values[k].data[lo - base:hi - base][::-1]
+            # Later steps win: keep the last write to every position
+            positions, latest = np.unique(indices, return_index=True)
+            array[positions] = values[latest]
+
+        self._cursor_index, self._cursor_array = index, array
+        return array
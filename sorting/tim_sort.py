@@ -0,0 +1,325 @@
+# sorting/tim_sort.py
+from .base_sorter import BaseSorter
+
+class TimSort(BaseSorter):
+    """
+    Tim Sort Algorithm (Adaptive Natural Merge Sort)
+
+    Steps:
+    1. Scan the array for natural runs (non-descending, or strictly
+       descending ones, which are reversed in place)
+    2. Extend runs shorter than minrun (32-64) with binary insertion sort
+    3. Keep the run lengths on a stack and merge neighbours whenever the
+       stack invariants break, so merges stay balanced
+    4. Merge with galloping: once one run wins min_gallop times in a row,
+       switch to exponential search and move whole blocks at once
+
+    Already sorted or reversed input is a single run and costs n - 1
+    comparisons; input made of a few sorted runs costs little more than
+    the merges of those runs.
+    """
+    MIN_GALLOP = 7  # Consecutive wins before switching to galloping mode
+
+    def __init__(self, array, **options):
+        super().__init__(array, **options)
+        self.min_gallop = self.MIN_GALLOP
+        self.natural_runs = 0  # Runs found before extension
+        self.galloped = 0  # Elements moved as blocks in galloping mode
+
+    def get_metrics(self):
+        metrics = super().get_metrics()
+        metrics['natural_runs'] = self.natural_runs
+        metrics['galloped'] = self.galloped
+        return metrics
+
+    def sort_steps(self):
+        arr = self.original_array.tolist()
+        n = len(arr)
+
+        yield self.record_step(arr, "Start Tim Sort (natural runs + galloping merge)")
+
+        if n < 2:
+            yield self.record_step(arr, "Array has 0 or 1 element. Already sorted!")
+            return arr
+
+        min_run = self._min_run(n)
+        yield self.record_step(arr, "Minimum run length for n = {}: {}", None, n, min_run)
+
+        runs = []  # Stack of (start, length)
+        lo = 0
+        while lo < n:
+            run_len, descending = self._count_run(arr, lo, n)
+            self.natural_runs += 1
+            yield self.record_step(
+                arr,
+                "Found strictly descending run [{}:{}], reversed it" if descending
+                else "Found natural run [{}:{}]",
+                {'sorted': range(lo, lo + run_len)},
+                lo, lo + run_len
+            )
+
+            if run_len < min_run:
+                force = min(n - lo, min_run)
+                self._binary_insertion_sort(arr, lo, lo + force, lo + run_len)
+                yield self.record_step(
+                    arr,
+                    "Extended run to [{}:{}] with binary insertion",
+                    {'sorted': range(lo, lo + force)},
+                    lo, lo + force
+                )
+                run_len = force
+
+            runs.append((lo, run_len))
+            yield from self._merge_collapse(arr, runs)
+            lo += run_len
+
+        # Merge whatever is left on the stack
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+            yield from self._merge_at(arr, runs, i)
+
+        yield self.record_step(arr, "Tim Sort completed!")
+        return arr
+
+    def _min_run(self, n):
+        """n itself below 64, else a length in [32, 64] so that n / minrun is close to a power of two."""
+        extra = 0
+        while n >= 64:
+            extra |= n & 1
+            n >>= 1
+        return n + extra
+
+    def _count_run(self, arr, lo, hi):
+        """Length of the run starting at lo, reversing it first if it is strictly descending."""
+        if lo + 1 == hi:
+            return 1, False
+        run_hi = lo + 2
+        if self.compare(arr[lo], arr[lo + 1]):
+            # Strictly descending (so reversing keeps equal elements in order)
+            while run_hi < hi and self.compare(arr[run_hi - 1], arr[run_hi]):
+                run_hi += 1
+            arr[lo:run_hi] = arr[lo:run_hi][::-1]
+            self.swaps += (run_hi - lo) // 2
+            return run_hi - lo, True
+        while run_hi < hi and not self.compare(arr[run_hi - 1], arr[run_hi]):
+            run_hi += 1
+        return run_hi - lo, False
+
+    def _binary_insertion_sort(self, arr, lo, hi, start):
+        """arr[lo:start] is sorted; insert arr[start:hi] into it using binary search."""
+        for i in range(start, hi):
+            pivot = arr[i]
+            left, right = lo, i
+            while left < right:
+                mid = (left + right) // 2
+                if self.compare(arr[mid], pivot):  # pivot < arr[mid]
+                    right = mid
+                else:
+                    left = mid + 1
+            arr[left + 1:i + 1] = arr[left:i]
+            arr[left] = pivot
+            self.swaps += i - left + 1  # Shifts plus the insertion
+
+    def _merge_collapse(self, arr, runs):
+        """
+        Merge until the stack lengths satisfy A > B + C and B > C (checked
+        on the top four runs, which closes the gap in the original rule).
+        """
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1])
+                    or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            yield from self._merge_at(arr, runs, i)
+
+    def _merge_at(self, arr, runs, i):
+        """Merge stack runs i and i + 1."""
+        base_a, len_a = runs[i]
+        base_b, len_b = runs[i + 1]
+        runs[i] = (base_a, len_a + len_b)
+        del runs[i + 1]
+        end = base_b + len_b
+
+        yield self.record_step(
+            arr,
+            "Merging runs [{}:{}] and [{}:{}]",
+            {'comparing': range(base_a, end)},
+            base_a, base_b, base_b, end
+        )
+
+        # Elements of A not greater than B's first element are already in place
+        skip = self._gallop_right(arr[base_b], arr, base_a, len_a, 0)
+        base_a += skip
+        len_a -= skip
+        # Elements of B not smaller than A's last element are already in place
+        len_b = self._gallop_left(arr[base_a + len_a - 1], arr, base_b, len_b, len_b - 1) if len_a else 0
+
+        galloped = self.galloped
+        if len_a and len_b:
+            # Copy the shorter run aside and merge from that end
+            if len_a <= len_b:
+                self._merge_lo(arr, base_a, len_a, len_b)
+            else:
+                self._merge_hi(arr, base_a, len_a, len_b)
+
+        yield self.record_step(
+            arr,
+            "Merged into sorted run [{}:{}] ({} elements already in place, {} moved by galloping)",
+            {'sorted': range(runs[i][0], end)},
+            runs[i][0], end, runs[i][1] - len_a - len_b, self.galloped - galloped
+        )
+
+    def _merge_lo(self, arr, lo, len_a, len_b):
+        """Merge A = arr[lo:lo+len_a] with the following B, copying A aside."""
+        a = arr[lo:lo + len_a]
+        i, j, k = 0, lo + len_a, lo
+        end_b = lo + len_a + len_b
+
+        while i < len_a and j < end_b:
+            # One pair at a time until one run keeps winning
+            wins_a = wins_b = 0
+            while i < len_a and j < end_b and max(wins_a, wins_b) < self.min_gallop:
+                if self.compare(a[i], arr[j]):  # B's element is smaller: take it
+                    arr[k] = arr[j]
+                    j += 1
+                    wins_b += 1
+                    wins_a = 0
+                else:
+                    arr[k] = a[i]
+                    i += 1
+                    wins_a += 1
+                    wins_b = 0
+                k += 1
+                self.swaps += 1
+
+            # Galloping: move whole blocks while they stay long
+            while i < len_a and j < end_b:
+                count = self._gallop_right(arr[j], a, i, len_a - i, 0)
+                arr[k:k + count] = a[i:i + count]
+                i, k = i + count, k + count
+                count_a = count
+                if i == len_a:
+                    self._count_galloped(count)
+                    break
+                count = self._gallop_left(a[i], arr, j, end_b - j, 0)
+                arr[k:k + count] = arr[j:j + count]
+                j, k = j + count, k + count
+                self._count_galloped(count_a + count)
+                if count_a < self.MIN_GALLOP and count < self.MIN_GALLOP:
+                    self.min_gallop += 1  # Galloping did not pay off; make it harder to enter
+                    break
+                self.min_gallop = max(1, self.min_gallop - 1)
+
+        # The rest of B is already in place
+        if i < len_a:
+            arr[k:k + len_a - i] = a[i:]
+            self.swaps += len_a - i
+
+    def _merge_hi(self, arr, lo, len_a, len_b):
+        """Merge A = arr[lo:lo+len_a] with the following B, copying B aside and filling from the end."""
+        b = arr[lo + len_a:lo + len_a + len_b]
+        i, j, k = lo + len_a - 1, len_b - 1, lo + len_a + len_b - 1
+
+        while i >= lo and j >= 0:
+            wins_a = wins_b = 0
+            while i >= lo and j >= 0 and max(wins_a, wins_b) < self.min_gallop:
+                if self.compare(arr[i], b[j]):  # A's element is larger: it goes last
+                    arr[k] = arr[i]
+                    i -= 1
+                    wins_a += 1
+                    wins_b = 0
+                else:
+                    arr[k] = b[j]
+                    j -= 1
+                    wins_b += 1
+                    wins_a = 0
+                k -= 1
+                self.swaps += 1
+
+            while i >= lo and j >= 0:
+                # Elements of A greater than b[j] move to the end as one block
+                count = i - lo + 1 - self._gallop_right(b[j], arr, lo, i - lo + 1, i - lo)
+                arr[k - count + 1:k + 1] = arr[i - count + 1:i + 1]
+                i, k = i - count, k - count
+                count_a = count
+                if i < lo:
+                    self._count_galloped(count)
+                    break
+                # Elements of B not smaller than arr[i] follow it
+                count = j + 1 - self._gallop_left(arr[i], b, 0, j + 1, j)
+                arr[k - count + 1:k + 1] = b[j - count + 1:j + 1]
+                j, k = j - count, k - count
+                self._count_galloped(count_a + count)
+                if count_a < self.MIN_GALLOP and count < self.MIN_GALLOP:
+                    self.min_gallop += 1
+                    break
+                self.min_gallop = max(1, self.min_gallop - 1)
+
+        # The rest of A is already in place
+        if j >= 0:
+            arr[lo:lo + j + 1] = b[:j + 1]
+            self.swaps += j + 1
+
+    def _count_galloped(self, count):
+        self.galloped += count
+        self.swaps += count
+
+    def _gallop_left(self, key, a, base, n, hint):
+        """
+        Leftmost position k in a[base:base+n] with a[base+k-1] < key <= a[base+k],
+        found by exponential search from base+hint, then binary search.
+        """
+        last, offset = 0, 1
+        if self.compare(key, a[base + hint]):  # a[hint] < key: search right
+            max_offset = n - hint
+            while offset < max_offset and self.compare(key, a[base + hint + offset]):
+                last, offset = offset, 2 * offset + 1
+            offset = min(offset, max_offset)
+            last, offset = last + hint, offset + hint
+        else:  # key <= a[hint]: search left
+            max_offset = hint + 1
+            while offset < max_offset and not self.compare(key, a[base + hint - offset]):
+                last, offset = offset, 2 * offset + 1
+            offset = min(offset, max_offset)
+            last, offset = hint - offset, hint - last
+
+        # Now a[base+last] < key <= a[base+offset]
+        last += 1
+        while last < offset:
+            mid = last + (offset - last) // 2
+            if self.compare(key, a[base + mid]):
+                last = mid + 1
+            else:
+                offset = mid
+        return offset
+
+    def _gallop_right(self, key, a, base, n, hint):
+        """Like _gallop_left, but returns the rightmost position: a[base+k-1] <= key < a[base+k]."""
+        last, offset = 0, 1
+        if self.compare(a[base + hint], key):  # key < a[hint]: search left
+            max_offset = hint + 1
+            while offset < max_offset and self.compare(a[base + hint - offset], key):
+                last, offset = offset, 2 * offset + 1
+            offset = min(offset, max_offset)
+            last, offset = hint - offset, hint - last
+        else:  # a[hint] <= key: search right
+            max_offset = n - hint
+            while offset < max_offset and not self.compare(a[base + hint + offset], key):
+                last, offset = offset, 2 * offset + 1
+            offset = min(offset, max_offset)
+            last, offset = last + hint, offset + hint
+
+        # Now a[base+last] <= key < a[base+offset]
+        last += 1
+        while last < offset:
+            mid = last + (offset - last) // 2
+            if self.compare(a[base + mid], key):
+                offset = mid
+            else:
+                last = mid + 1
+        return offset
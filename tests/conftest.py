@@ -0,0 +1,8 @@
+# tests/conftest.py
+import os
+import sys
+
+# Import the application packages from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# GUI tests render offscreen, without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -0,0 +1,53 @@
+# tests/test_data_loader.py
+import numpy as np
+import pytest
+from utils.data_loader import CHUNK_BYTES, load_array, parse_values
+
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data if isinstance(data, bytes) else data.encode())
+    return str(path)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("\n1,2\n3,4\n", [1, 2, 3, 4]),
+    ("\r\n5,2\r\n", [5, 2]),
+    ("\n\n  \nx,y\n1,2\n", [1, 2]),
+])
+def test_leading_blank_lines_add_no_values(tmp_path, text, expected):
+    assert load_array(write(tmp_path, "data.csv", text)).tolist() == expected
+
+
+def test_blank_input_is_empty(tmp_path):
+    assert len(parse_values(" \n ")) == 0
+    assert len(load_array(write(tmp_path, "blank.csv", "\n\n"))) == 0
+
+
+def test_whitespace_only_chunk_adds_no_values(tmp_path):
+    # A whole read chunk of newlines between two rows
+    text = "1,2\n" + "\n" * (2 * CHUNK_BYTES) + "3,4\n"
+    assert load_array(write(tmp_path, "gap.csv", text)).tolist() == [1, 2, 3, 4]
+
+
+def test_header_column_by_name(tmp_path):
+    path = write(tmp_path, "header.csv", "a,b\n1,2.5\n3,4.5\n")
+    values = load_array(path, column="b")
+    assert values.dtype == np.float64
+    assert values.tolist() == [2.5, 4.5]
+
+
+def test_byte_order_mark_is_not_a_header(tmp_path):
+    path = write(tmp_path, "bom.csv", "﻿5,2,8,1\r\n3,4,6,7")
+    assert load_array(path).tolist() == [5, 2, 8, 1, 3, 4, 6, 7]
+
+
+def test_byte_order_mark_before_header(tmp_path):
+    path = write(tmp_path, "bom_header.csv", "﻿a,b\n1,2\n3,4\n")
+    assert load_array(path, column="a").tolist() == [1, 3]
+
+
+@pytest.mark.parametrize("text", ["1,2,abc\n3,4,5\n", "1,2,abc"])
+def test_mixed_first_row_is_an_error(tmp_path, text):
+    with pytest.raises(ValueError, match="Non-numeric value in data: 'abc'"):
+        load_array(write(tmp_path, "mixed.csv", text))
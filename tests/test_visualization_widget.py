@@ -0,0 +1,31 @@
+# tests/test_visualization_widget.py
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+from PyQt6.QtWidgets import QApplication
+from gui.visualization_widget import VisualizationWidget
+from sorting import get_sorter
+from utils.array_generator import generate_array
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.parametrize("algorithm", ["Heap Sort", "Quick Sort", "Bubble Sort"])
+def test_incremental_updates_match_full_redraw(app, algorithm):
+    """Replaying a trace bar by bar leaves no stale pixels, e.g. outlines of the last bar."""
+    sorter = get_sorter(algorithm, generate_array(120, "random", seed=0))
+    sorter.sort()
+    incremental, full = VisualizationWidget(), VisualizationWidget()
+    for widget in (incremental, full):
+        widget.resize(900, 300)
+        widget.show()
+
+    for index in range(0, min(len(sorter.steps), 600)):
+        step = sorter.steps[index]
+        incremental.update_array(step.array, step.highlights)
+        full.update_array(step.array, step.highlights)
+        full.invalidate()
+        assert incremental.grab().toImage() == full.grab().toImage(), f"step {index} differs"
@@ -1,19 +1,24 @@
 # utils/array_generator.py
 import numpy as np
 
-def generate_array(size, array_type="random"):
+DISTRIBUTIONS = ["random", "ascending", "descending", "nearly_sorted"]
+
+def generate_array(size, array_type="random", seed=None):
     """
     Generate an array of given size and type.
     
     Parameters:
         size (int): Number of elements.
         array_type (str): One of 'random', 'ascending', 'descending', 'nearly_sorted'.
+        seed (int, optional): Seed for reproducible arrays. Uses the global
+            NumPy random state when omitted.
     
     Returns:
         np.ndarray: Generated array.
     """
+    rng = np.random if seed is None else np.random.RandomState(seed)
     if array_type == "random":
-        return np.random.randint(1, 1000, size)
+        return rng.randint(1, 1000, size)
     elif array_type == "ascending":
         return np.arange(1, size + 1)
     elif array_type == "descending":
@@ -23,9 +28,9 @@ def generate_array(size, array_type="random"):
         # Swap ~5% of adjacent pairs to create near-sortedness
         num_swaps = max(1, size // 20)
         for _ in range(num_swaps):
-            i = np.random.randint(0, size - 1)
+            i = rng.randint(0, size - 1)
             arr[i], arr[i + 1] = arr[i + 1], arr[i]
         return arr
     else:
         # Fallback to random
-        return np.random.uniform(1, 1000, size).astype(int)
\ No newline at end of file
+        return rng.uniform(1, 1000, size).astype(int)
\ No newline at end of file
@@ -0,0 +1,343 @@
+# utils/benchmark.py
+import csv
+import json
+import os
+import random
+import time
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from sorting import SORTER_MAP, get_sorter
+from utils.array_generator import DISTRIBUTIONS, generate_array
+
+DEFAULT_SIZES = [64, 256, 1024]
+
+# Sizes above these limits are skipped (Bogo Sort is O(n × n!))
+SIZE_LIMITS = {"Bogo Sort": 8}
+
+# Columns written to CSV, in order
+FIELDS = ["algorithm", "distribution", "size", "seed", "status", "time",
+          "comparisons", "swaps", "steps", "peak_memory"]
+
+# Counters that must not grow for the same (algorithm, distribution, size, seed)
+EXACT_FIELDS = ["comparisons", "swaps", "steps"]
+
+# Seconds a job may run past its timeout before its worker process is killed
+# (jobs normally notice the deadline themselves, see _run_sorter)
+KILL_GRACE = 1.0
+
+
+def _run_sorter(algorithm, array, seed, record_steps, deadline, vectorized=False):
+    """Sort once, returning the sorter, or None if the deadline passed first."""
+    random.seed(seed)
+    # Algorithms without a vectorized mode run their instrumented path
+    vectorized = vectorized and SORTER_MAP[algorithm].supports_vectorized
+    sorter = get_sorter(algorithm, array, record_steps=record_steps, vectorized=vectorized)
+    # Steps are pulled one by one so a slow job can be abandoned cooperatively
+    for count, _ in enumerate(sorter.iter_steps()):
+        if deadline is not None and count & 255 == 0 and time.perf_counter() > deadline:
+            return None
+    # Sorters that yield rarely (vectorized and metrics-only runs) are only caught here
+    if deadline is not None and time.perf_counter() > deadline:
+        return None
+    return sorter
+
+
+def benchmark_one(algorithm, size, distribution="random", seed=0,
+                  record_steps=True, measure_memory=True, repeat=1, timeout=None,
+                  vectorized=False):
+    """
+    Run one algorithm on one generated array and collect its metrics.
+
+    Parameters:
+        algorithm (str): Name of the algorithm in SORTER_MAP.
+        size (int): Number of elements.
+        distribution (str): Input type passed to generate_array.
+        seed (int): Seed for the input array and for randomized algorithms.
+        record_steps (bool): Record the full trace (False for metrics-only).
+        measure_memory (bool): Do a second run under tracemalloc for peak memory.
+        repeat (int): Number of timed runs; the fastest one is reported.
+        timeout (float, optional): Seconds allowed for the whole job. Jobs that
+            run over are abandoned and reported with status 'timeout'.
+        vectorized (bool): Use the NumPy fast path where the sorter has one.
+
+    Returns:
+        dict: One result row with the keys listed in FIELDS.
+    """
+    row = {
+        'algorithm': algorithm,
+        'distribution': distribution,
+        'size': size,
+        'seed': seed,
+        'status': 'ok',
+        'time': None,
+        'comparisons': None,
+        'swaps': None,
+        'steps': None,
+        'peak_memory': None
+    }
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    array = generate_array(size, distribution, seed=seed)
+
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        sorter = _run_sorter(algorithm, array, seed, record_steps, deadline, vectorized)
+        elapsed = time.perf_counter() - started
+        if sorter is None:
+            row['status'] = 'timeout'
+            return row
+        row['time'] = elapsed if row['time'] is None else min(row['time'], elapsed)
+
+    row['comparisons'] = sorter.comparisons
+    row['swaps'] = sorter.swaps
+    row['steps'] = len(sorter.steps)
+
+    # tracemalloc slows the sort down, so memory is measured in a separate run
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            if _run_sorter(algorithm, array, seed, record_steps, deadline, vectorized) is not None:
+                row['peak_memory'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return row
+
+
+def _benchmark_job(job, options):
+    """Process pool entry point: run one job and turn failures into a result row."""
+    algorithm, size, distribution, seed = job
+    try:
+        return benchmark_one(algorithm, size, distribution, seed, **options)
+    except Exception as e:
+        return _failed_row(job, f"error: {e}")
+
+
+def _failed_row(job, status):
+    algorithm, size, distribution, seed = job
+    return {
+        'algorithm': algorithm, 'distribution': distribution, 'size': size,
+        'seed': seed, 'status': status, 'time': None, 'comparisons': None,
+        'swaps': None, 'steps': None, 'peak_memory': None
+    }
+
+
+def benchmark_jobs(algorithms=None, sizes=None, distributions=None, seeds=(0,)):
+    """Expand the benchmark matrix into (algorithm, size, distribution, seed) jobs."""
+    jobs = []
+    for algorithm in algorithms or list(SORTER_MAP):
+        limit = SIZE_LIMITS.get(algorithm)
+        for size in sizes or DEFAULT_SIZES:
+            if limit is not None and size > limit:
+                continue
+            for distribution in distributions or DISTRIBUTIONS:
+                for seed in seeds:
+                    jobs.append((algorithm, size, distribution, seed))
+    return jobs
+
+
+def run_benchmark(algorithms=None, sizes=None, distributions=None, seeds=(0,),
+                  record_steps=True, measure_memory=True, repeat=1, timeout=None,
+                  vectorized=False, workers=1, progress=None):
+    """
+    Run every algorithm over a sweep of sizes and input distributions.
+
+    Parameters:
+        algorithms (list, optional): Algorithm names; defaults to all of SORTER_MAP.
+        sizes (list, optional): Array sizes; defaults to DEFAULT_SIZES.
+        distributions (list, optional): Input types; defaults to DISTRIBUTIONS.
+        seeds (iterable): One run per seed, for reproducible inputs.
+        record_steps (bool): Record full traces (needed for the 'steps' column).
+        measure_memory (bool): Measure peak memory with tracemalloc.
+        repeat (int): Timed runs per job; the fastest one is reported.
+        timeout (float, optional): Per-job time limit in seconds. Jobs are run
+            in worker processes (even with workers=1), and a job still running
+            KILL_GRACE seconds past its limit has its worker killed.
+        vectorized (bool): Use the NumPy fast path where the sorter has one.
+        workers (int, optional): Number of worker processes. 1 runs the jobs in
+            this process unless a timeout is given; None uses one process per
+            CPU core.
+        progress (callable, optional): Called as progress(done, total, row).
+
+    Returns:
+        list: Result rows as returned by benchmark_one, in job order.
+    """
+    jobs = benchmark_jobs(algorithms, sizes, distributions, seeds)
+    options = {
+        'record_steps': record_steps,
+        'measure_memory': measure_memory,
+        'repeat': repeat,
+        'timeout': timeout,
+        'vectorized': vectorized
+    }
+
+    if workers == 1 and timeout is None:
+        results = []
+        for job in jobs:
+            results.append(_benchmark_job(job, options))
+            if progress:
+                progress(len(results), len(jobs), results[-1])
+        return results
+    return _run_in_processes(jobs, options, workers, timeout, progress)
+
+
+def _run_in_processes(jobs, options, workers, timeout, progress):
+    """
+    Run jobs in a process pool. At most one job per worker is in flight, so a
+    job starts when it is submitted; with a timeout, a job that overruns by
+    KILL_GRACE has its result reported as 'timeout' and the pool is replaced
+    (the other jobs in flight are started again).
+    """
+    # Jobs are independent and CPU-bound, so spread them over processes
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers)
+    limit = None if timeout is None else timeout + KILL_GRACE
+    results = [None] * len(jobs)
+    queue = list(range(len(jobs)))[::-1]  # Job indexes, next one last
+    running = {}  # future -> (job index, start time)
+    done = 0
+
+    def finish(i, row):
+        nonlocal done
+        results[i] = row
+        done += 1
+        if progress:
+            progress(done, len(jobs), row)
+
+    try:
+        while queue or running:
+            while queue and len(running) < workers:
+                i = queue.pop()
+                running[pool.submit(_benchmark_job, jobs[i], options)] = (i, time.perf_counter())
+
+            wait_for = None
+            if limit is not None:
+                oldest = min(started for _, started in running.values())
+                wait_for = max(0.0, oldest + limit - time.perf_counter())
+            finished, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i, _ = running.pop(future)
+                finish(i, future.result())
+
+            now = time.perf_counter()
+            overdue = [f for f, (_, started) in running.items() if now - started >= limit] if limit else []
+            if overdue:
+                for future in overdue:
+                    i, _ = running.pop(future)
+                    finish(i, _failed_row(jobs[i], 'timeout'))
+                # A running job cannot be cancelled, so replace the whole pool
+                queue.extend(i for i, _ in running.values())
+                running.clear()
+                _kill_pool(pool)
+                pool = ProcessPoolExecutor(max_workers=workers)
+    finally:
+        if running:  # Interrupted, e.g. by Ctrl+C
+            _kill_pool(pool)
+        else:
+            pool.shutdown()
+    return results
+
+
+def _kill_pool(pool):
+    """Terminate the worker processes of a ProcessPoolExecutor and discard it."""
+    # ProcessPoolExecutor only has a public terminate_workers() from Python 3.14
+    processes = list((pool._processes or {}).values())
+    for process in processes:
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.join()
+
+
+def format_table(results):
+    """Format result rows as a plain-text table for the console."""
+    columns = [("Algorithm", 'algorithm'), ("Input", 'distribution'), ("n", 'size'),
+               ("Status", 'status'), ("Time (s)", 'time'), ("Comparisons", 'comparisons'),
+               ("Swaps", 'swaps'), ("Steps", 'steps'), ("Peak mem", 'peak_memory')]
+
+    def cell(row, field):
+        value = row.get(field)
+        if value is None:
+            return "-"
+        return f"{value:.4f}" if field == 'time' else str(value)
+
+    rows = [[cell(row, field) for _, field in columns] for row in results]
+    widths = [max([len(title)] + [len(r[i]) for r in rows]) for i, (title, _) in enumerate(columns)]
+    lines = ["  ".join(title.ljust(w) for (title, _), w in zip(columns, widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    lines.extend("  ".join(value.ljust(w) for value, w in zip(r, widths)) for r in rows)
+    return "\n".join(lines)
+
+
+def write_csv(results, path):
+    """Write result rows to a CSV file."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def write_json(results, path):
+    """Write result rows to a JSON file."""
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path):
+    """Load result rows saved by write_json or write_csv."""
+    if path.endswith('.csv'):
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            for field in FIELDS:
+                value = row.get(field)
+                if field in ('algorithm', 'distribution', 'status'):
+                    continue
+                if value in (None, ''):
+                    row[field] = None
+                else:
+                    row[field] = float(value) if field == 'time' else int(value)
+        return rows
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_to_baseline(results, baseline, time_tolerance=0.25, memory_tolerance=0.10,
+                        min_time_delta=0.005):
+    """
+    Compare benchmark results against a saved baseline.
+
+    Comparisons, swaps and steps are deterministic for a given seed, so any
+    increase is reported. Time and peak memory are reported when they grow by
+    more than the given relative tolerance (and, for time, by more than
+    min_time_delta seconds, to ignore noise on tiny inputs). Jobs that used
+    to finish but now time out or fail are reported as well.
+
+    Returns:
+        list: Human readable descriptions of every regression found.
+    """
+    def key(row):
+        return (row['algorithm'], row['distribution'], int(row['size']), int(row['seed']))
+
+    previous = {key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get(key(row))
+        if old is None or old.get('status', 'ok') != 'ok':
+            continue
+        label = "{} [{}, n={}, seed={}]".format(*key(row))
+        if row['status'] != 'ok':
+            regressions.append(f"{label}: {row['status']}")
+            continue
+
+        for field in EXACT_FIELDS:
+            if old.get(field) is not None and row[field] > old[field]:
+                regressions.append(f"{label}: {field} {old[field]} → {row[field]}")
+
+        if (row['time'] > old['time'] * (1 + time_tolerance)
+                and row['time'] - old['time'] > min_time_delta):
+            regressions.append(f"{label}: time {old['time']:.4f}s → {row['time']:.4f}s")
+
+        if (old.get('peak_memory') and row.get('peak_memory')
+                and row['peak_memory'] > old['peak_memory'] * (1 + memory_tolerance)):
+            regressions.append(f"{label}: peak memory {old['peak_memory']} → {row['peak_memory']} bytes")
+    return regressions
@@ -0,0 +1,185 @@
+# utils/data_loader.py
+import codecs
+import os
+import warnings
+import numpy as np
+
+# Raw binary files: headerless little-endian values, recognized by extension
+RAW_DTYPES = {
+    '.i32': np.dtype('<i4'),
+    '.int32': np.dtype('<i4'),
+    '.f64': np.dtype('<f8'),
+    '.float64': np.dtype('<f8'),
+}
+FILE_FILTER = ("Data Files (*.csv *.tsv *.txt *.npy *.i32 *.int32 *.f64 *.float64);;"
+               "CSV/TSV Files (*.csv *.tsv *.txt);;NumPy Arrays (*.npy);;"
+               "Raw Binary (*.i32 *.int32 *.f64 *.float64);;All Files (*)")
+CHUNK_BYTES = 1 << 22  # Text and raw files are read 4 MiB at a time
+DELIMITERS = b',;\t|'  # Treated like whitespace in text files
+_SPACES = bytes.maketrans(DELIMITERS, b' ' * len(DELIMITERS))
+
+
+def load_array(path, column=None, mmap=False, progress=None):
+    """
+    Load a 1-D numeric array from a data file.
+
+    Parameters:
+        path (str): A CSV/TSV/text file (values separated by commas,
+            semicolons, tabs, pipes or whitespace, on any number of lines),
+            a .npy file, or a raw little-endian .i32/.int32 or .f64/.float64 file.
+        column (int or str, optional): For multi-column text files, the
+            column to load (index, or header name when the file has a header
+            line). By default every value is loaded, row by row.
+        mmap (bool): Memory-map .npy and raw files instead of reading them.
+        progress (callable, optional): Called as progress(bytes_done, bytes_total)
+            after every chunk.
+
+    Returns:
+        np.ndarray: int64 if every value is a whole number, float64 otherwise
+            (raw and .npy files keep their own dtype).
+
+    Raises:
+        ValueError: If the file holds non-numeric data or ragged columns.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    total = os.path.getsize(path)
+    if ext == '.npy':
+        array = np.load(path, mmap_mode='r' if mmap else None).reshape(-1)
+        if progress:
+            progress(total, total)
+        return array
+    if ext in RAW_DTYPES:
+        return _load_raw(path, RAW_DTYPES[ext], total, mmap, progress)
+    return _load_text(path, column, total, progress)
+
+
+def parse_values(text):
+    """Parse values typed by hand ("5,2,8,1", one per line, ...) like a text file."""
+    values = _parse_chunk(text.encode() if isinstance(text, str) else text)
+    return _narrow(values)
+
+
+def _load_raw(path, dtype, total, mmap, progress):
+    if total % dtype.itemsize:
+        raise ValueError(f"File size {total} is not a multiple of {dtype.itemsize} bytes ({dtype.name})")
+    count = total // dtype.itemsize
+    if mmap:
+        array = np.memmap(path, dtype=dtype, mode='r', shape=(count,))
+        if progress:
+            progress(total, total)
+        return array
+
+    array = np.empty(count, dtype=dtype)
+    per_chunk = CHUNK_BYTES // dtype.itemsize
+    with open(path, 'rb') as f:
+        for start in range(0, count, per_chunk):
+            stop = min(start + per_chunk, count)
+            f.readinto(memoryview(array[start:stop]).cast('B'))
+            if progress:
+                progress(stop * dtype.itemsize, total)
+    return array
+
+
+def _load_text(path, column, total, progress):
+    chunks = []
+    done = 0
+    columns = None  # Values per row; only needed to pick a column
+    with open(path, 'rb') as f:
+        first = f.readline()
+        done += len(first)
+        # Files saved by Excel and Notepad may start with a UTF-8 byte order mark
+        if first.startswith(codecs.BOM_UTF8):
+            first = first[len(codecs.BOM_UTF8):]
+        # Blank lines before the first row or header are skipped
+        while first and not first.strip():
+            first = f.readline()
+            done += len(first)
+        # The first line is parsed as data (in C); only if that fails is it
+        # checked for a header, which may hold the whole file as one row
+        try:
+            chunks.append(_parse_chunk(first))
+            header = None
+        except ValueError:
+            header = _header(first)
+            if header is None:
+                raise  # A row mixing numbers and text is bad data, not a header
+        if header is None:
+            if isinstance(column, str):
+                raise ValueError(f"Column {column!r} given by name, but the file has no header line")
+            columns = len(chunks[0])
+        else:
+            columns = len(header)
+            if isinstance(column, str):
+                if column not in header:
+                    raise ValueError(f"No column named {column!r} (columns: {', '.join(header)})")
+                column = header.index(column)
+
+        rest = b''
+        while True:
+            block = f.read(CHUNK_BYTES)
+            if not block:
+                break
+            done += len(block)
+            # Only parse complete lines; the partial last line waits for the next chunk
+            cut = block.rfind(b'\n') + 1
+            if cut:
+                chunks.append(_parse_chunk(rest + block[:cut]))
+                rest = block[cut:]
+            else:
+                rest += block
+            if progress:
+                progress(done, total)
+        if rest.strip():
+            chunks.append(_parse_chunk(rest))
+    if progress:
+        progress(total, total)
+
+    values = np.concatenate(chunks) if chunks else np.empty(0)
+    if column is not None:
+        if not columns or len(values) % columns:
+            raise ValueError(f"Rows do not all have {columns} columns; cannot select column {column}")
+        if not -columns <= column < columns:
+            raise ValueError(f"Column {column} out of range (the file has {columns} columns)")
+        values = values.reshape(-1, columns)[:, column]
+    return _narrow(values)
+
+
+def _header(line):
+    """Column names if no field of the line is a number, else None."""
+    fields = line.translate(_SPACES).split()
+    if any(_is_number(field) for field in fields):
+        return None
+    return [field.decode(errors='replace').strip('"\'') for field in fields]
+
+
+def _parse_chunk(data):
+    """Parse a block of delimited numbers into float64 values (in C, via np.fromstring)."""
+    data = data.translate(_SPACES)
+    if not data.strip():
+        # np.fromstring returns [-1.] for whitespace-only input
+        return np.empty(0)
+    with warnings.catch_warnings():
+        # Older NumPy versions only warn when parsing stops at a bad value
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromstring(data, dtype=np.float64, sep=' ')
+        except (ValueError, DeprecationWarning):
+            bad = next((f for f in data.split() if not _is_number(f)), None)
+            detail = f": {bad.decode(errors='replace')!r}" if bad else ""
+            raise ValueError(f"Non-numeric value in data{detail}") from None
+
+
+def _is_number(field):
+    try:
+        float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def _narrow(values):
+    """Keep whole numbers as int64, like the generated arrays."""
+    if (len(values) and np.all(np.isfinite(values)) and np.all(values == np.floor(values))
+            and np.all(np.abs(values) < 2 ** 53)):
+        return values.astype(np.int64)
+    return values
@@ -0,0 +1,27 @@
+# utils/startup_timer.py
+import time
+
+class StartupTimer:
+    """
+    Wall-clock checkpoints for measuring cold start.
+
+    mark(label) records the moment a startup phase finished; report() lists
+    every phase with its own duration and the running total since the timer
+    was created.
+    """
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.marks = []  # (label, seconds since start)
+
+    def mark(self, label):
+        self.marks.append((label, time.perf_counter() - self.started))
+
+    def report(self):
+        """Return the phases as a plain-text table (milliseconds)."""
+        width = max((len(label) for label, _ in self.marks), default=0)
+        lines = [f"{'Startup phase':<{width}}  {'Phase':>9}  {'Total':>9}"]
+        previous = 0.0
+        for label, at in self.marks:
+            lines.append(f"{label:<{width}}  {1000 * (at - previous):7.1f}ms  {1000 * at:7.1f}ms")
+            previous = at
+        return "\n".join(lines)